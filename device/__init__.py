@@ -11,6 +11,10 @@ from .device_client import (
     create_device_client
 )
 
+from .udp_driver import UDPDriver
+from .async_udp_driver import AsyncUDPDriver
+from .serial_driver import SerialDriver
+
 from .exceptions import (
     DeviceError,
     ConnectionError,
@@ -21,9 +25,12 @@ from .exceptions import (
 __all__ = [
     'DeviceClient',
     'DeviceConfig',
-    'DeviceReading', 
+    'DeviceReading',
     'InterfaceType',
     'create_device_client',
+    'UDPDriver',
+    'AsyncUDPDriver',
+    'SerialDriver',
     'DeviceError',
     'ConnectionError',
     'TimeoutError',
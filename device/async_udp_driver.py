@@ -0,0 +1,188 @@
+#!/usr/bin/env python3.10
+"""
+Асинхронный UDP драйвер для работы с устройством
+
+Построен на asyncio.DatagramProtocol: один event loop может одновременно
+ждать ответы нескольких устройств, перекрывая их сетевые задержки в одном
+потоке. Ответы сопоставляются с запросами по префиксу (V_/A_/S_), поэтому
+три команды одного устройства тоже выполняются параллельно через gather.
+"""
+
+import asyncio
+import logging
+from typing import Optional, Tuple
+from .exceptions import ConnectionError, TimeoutError, ProtocolError
+
+logger = logging.getLogger(__name__)
+
+_CMD_V = b"GET_V"
+_CMD_A = b"GET_A"
+_CMD_S = b"GET_S"
+_PREFIX = {_CMD_V: "V_", _CMD_A: "A_", _CMD_S: "S_"}
+
+
+class _UDPClientProtocol(asyncio.DatagramProtocol):
+    """
+    Протокол asyncio для обмена с устройством
+
+    Входящие датаграммы разрешают futures, заведенные на префикс
+    ожидаемого ответа — порядок прихода ответов не важен.
+    """
+
+    def __init__(self):
+        self.transport = None
+        self._pending = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        response = data.decode('utf-8', errors='ignore').strip()
+        future = self._pending.pop(response[:2], None)
+        if future is not None and not future.done():
+            future.set_result(response)
+        else:
+            logger.debug("Непрошенный ответ от %s: %s", addr, response)
+
+    def error_received(self, exc):
+        # ICMP port unreachable и подобное: роняем все ожидающие futures
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"Ошибка сокета: {exc}"))
+        self._pending.clear()
+
+    def connection_lost(self, exc):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Соединение закрыто"))
+        self._pending.clear()
+
+    def expect(self, prefix: str) -> asyncio.Future:
+        """Регистрация ожидания ответа с заданным префиксом"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[prefix] = future
+        return future
+
+
+class AsyncUDPDriver:
+    """
+    Асинхронный драйвер для работы с устройством по UDP
+    """
+
+    __slots__ = ('host', 'port', 'timeout', 'transport', 'protocol', 'is_connected')
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 10000, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.transport = None
+        self.protocol: Optional[_UDPClientProtocol] = None
+        self.is_connected = False
+
+        logger.debug("Async UDP драйвер инициализирован: %s:%s", host, port)
+
+    async def connect(self) -> bool:
+        """
+        Подключение к устройству
+
+        Returns:
+            bool: True если подключение успешно
+
+        Raises:
+            ConnectionError: Если не удалось подключиться
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            self.transport, self.protocol = await loop.create_datagram_endpoint(
+                _UDPClientProtocol,
+                remote_addr=(self.host, self.port)
+            )
+
+            # Тестовый запрос для проверки соединения
+            response = await self._request(_CMD_S)
+            logger.info("Успешно подключено к устройству %s:%s (%s)",
+                        self.host, self.port, response)
+            self.is_connected = True
+            return True
+
+        except (ConnectionError, TimeoutError):
+            self._close_transport()
+            raise
+        except Exception as e:
+            self._close_transport()
+            logger.error("Ошибка подключения к %s:%s: %s", self.host, self.port, e)
+            raise ConnectionError(f"Не удалось подключиться к {self.host}:{self.port}: {e}")
+
+    async def _request(self, command: bytes) -> str:
+        """
+        Отправка команды и ожидание ответа с соответствующим префиксом
+
+        Args:
+            command: Команда (байтовая константа)
+
+        Returns:
+            str: Ответ устройства
+
+        Raises:
+            TimeoutError: Если ответ не пришел за self.timeout
+            ConnectionError: При ошибке сокета
+        """
+        if self.transport is None or self.protocol is None:
+            raise ConnectionError("Устройство не подключено")
+
+        future = self.protocol.expect(_PREFIX[command])
+        self.transport.sendto(command)
+
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.protocol._pending.pop(_PREFIX[command], None)
+            raise TimeoutError(
+                f"Таймаут ожидания ответа на {command.decode()} от {self.host}:{self.port}")
+
+    async def get_voltage(self) -> str:
+        """Запрос напряжения"""
+        return await self._request(_CMD_V)
+
+    async def get_current(self) -> str:
+        """Запрос тока"""
+        return await self._request(_CMD_A)
+
+    async def get_serial(self) -> str:
+        """Запрос серийного номера"""
+        return await self._request(_CMD_S)
+
+    async def get_triplet(self) -> Tuple[str, str, str]:
+        """
+        Получение всех трёх показаний параллельно
+
+        Три запроса уходят одновременно, ответы ждутся одним gather —
+        суммарная задержка равна максимальной из трёх, а не их сумме.
+
+        Returns:
+            tuple: (напряжение, ток, серийный номер)
+        """
+        return tuple(await asyncio.gather(
+            self._request(_CMD_V),
+            self._request(_CMD_A),
+            self._request(_CMD_S),
+        ))
+
+    def _close_transport(self):
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+            self.protocol = None
+
+    def disconnect(self):
+        """Отключение от устройства"""
+        self._close_transport()
+        self.is_connected = False
+        logger.info("Отключено от устройства %s:%s", self.host, self.port)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
@@ -7,10 +7,10 @@
 import logging
 import json
 from typing import Dict, Any, Optional, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, replace
 from enum import Enum
+from functools import lru_cache
 import time
-from datetime import datetime
 
 from .udp_driver import UDPDriver
 from .serial_driver import SerialDriver
@@ -25,6 +25,13 @@ class InterfaceType(Enum):
     COM = "com"  # alias для serial
 
 
+# Таблица значение -> член enum, чтобы не вызывать InterfaceType(...)
+# (линейный поиск по членам) на каждое создание конфига.
+# Алиас "com" нормализуется в SERIAL сразу при разборе конфига.
+_IFACE_MAP = {member.value: member for member in InterfaceType}
+_IFACE_MAP['com'] = InterfaceType.SERIAL
+
+
 @dataclass
 class DeviceConfig:
     """Конфигурация устройства"""
@@ -37,16 +44,22 @@ class DeviceConfig:
     
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'DeviceConfig':
-        """Создание конфига из словаря"""
-        # Конвертируем строку в InterfaceType
-        if 'interface' in config_dict:
-            if isinstance(config_dict['interface'], str):
-                config_dict['interface'] = InterfaceType(config_dict['interface'].lower())
-        
-        return cls(**config_dict)
+        """Создание конфига из словаря (лишние ключи игнорируются)"""
+        # Конвертируем строку в InterfaceType через предвычисленную таблицу
+        iface = config_dict.get('interface')
+        if isinstance(iface, str):
+            config_dict['interface'] = _IFACE_MAP[iface.lower()]
 
+        return cls(**{k: v for k, v in config_dict.items() if k in _CFG_FIELDS})
 
-@dataclass
+
+# Имена полей конфига вычисляем один раз, а не интроспекцией на каждый вызов
+_CFG_FIELDS = frozenset(f.name for f in fields(DeviceConfig))
+
+
+# slots=True: без __dict__ экземпляр вдвое компактнее и быстрее в доступе
+# к полям; не frozen — потоковый опрос переиспользует один экземпляр
+@dataclass(slots=True)
 class DeviceReading:
     """Показания устройства"""
     timestamp: str
@@ -57,12 +70,51 @@ class DeviceReading:
     error: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Конвертация в словарь"""
-        return asdict(self)
-    
+        """Конвертация в словарь (без интроспекции asdict — форма известна заранее)"""
+        return {
+            'timestamp': self.timestamp,
+            'voltage': self.voltage,
+            'current': self.current,
+            'serial': self.serial,
+            'status': self.status,
+            'error': self.error,
+        }
+
     def to_json(self) -> str:
-        """Конвертация в JSON"""
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+        """Конвертация в JSON (шаблон собран вручную, поля экранируются json.dumps)"""
+        err = 'null' if self.error is None else json.dumps(self.error, ensure_ascii=False)
+        return (f'{{"timestamp": {json.dumps(self.timestamp)}, '
+                f'"voltage": {json.dumps(self.voltage)}, '
+                f'"current": {json.dumps(self.current)}, '
+                f'"serial": {json.dumps(self.serial)}, '
+                f'"status": {json.dumps(self.status)}, '
+                f'"error": {err}}}')
+
+
+# Неизменяемый шаблон ошибочного показания: константные поля готовы
+# заранее, при ошибке остается подставить метку времени и текст ошибки
+_ERROR_TEMPLATE = DeviceReading(
+    timestamp='',
+    voltage='V_ERROR',
+    current='A_ERROR',
+    serial='S_ERROR',
+    status='ERROR',
+    error=None,
+)
+
+
+def error_reading(timestamp: str, error: str) -> DeviceReading:
+    """
+    Создание показания-ошибки из готового шаблона
+
+    Args:
+        timestamp: Метка времени
+        error: Текст ошибки
+
+    Returns:
+        DeviceReading: Показание со статусом ERROR
+    """
+    return replace(_ERROR_TEMPLATE, timestamp=timestamp, error=error)
 
 
 class DeviceClient:
@@ -96,7 +148,18 @@ class DeviceClient:
         >>> with DeviceClient(config) as device:
         >>>     reading = device.get_reading()
     """
-    
+
+    # Таблица диспетчеризации: тип интерфейса -> фабрика драйвера
+    # (COM — устаревший алиас SERIAL, ведет к тому же драйверу)
+    _DRIVERS = {
+        InterfaceType.UDP: lambda c: UDPDriver(
+            host=c.host, port=c.port, timeout=c.timeout),
+        InterfaceType.SERIAL: lambda c: SerialDriver(
+            port=c.serial_port, baudrate=c.baudrate),
+    }
+    _DRIVERS[InterfaceType.COM] = _DRIVERS[InterfaceType.SERIAL]
+
+
     def __init__(self, config: DeviceConfig):
         """
         Инициализация клиента устройства
@@ -106,25 +169,25 @@ class DeviceClient:
         """
         self.config = config
         self.driver = None
-        self.is_connected = False
-        
-        logger.info(f"Инициализирован DeviceClient: {config.interface.value}")
-        
-        # Создаем драйвер в зависимости от типа интерфейса "UDP" или "serial"
-        if config.interface in [InterfaceType.UDP]:
-            self.driver = UDPDriver(
-                host=config.host,
-                port=config.port,
-                timeout=config.timeout
-            )
-        elif config.interface in [InterfaceType.SERIAL, InterfaceType.COM]:
-            self.driver = SerialDriver(
-                port=config.serial_port,
-                baudrate=config.baudrate
-            )
-        else:
+
+        # Кэш секундной части метки времени: strftime и объект datetime
+        # не создаются заново на каждое показание в пределах одной секунды
+        self._last_sec = 0
+        self._last_prefix = ''
+
+        logger.info("Инициализирован DeviceClient: %s", config.interface.value)
+
+        # Создаем драйвер по таблице диспетчеризации (O(1), без if/elif)
+        try:
+            self.driver = self._DRIVERS[config.interface](config)
+        except KeyError:
             raise ValueError(f"Неподдерживаемый интерфейс: {config.interface}")
-    
+
+    @property
+    def is_connected(self) -> bool:
+        """Состояние соединения (единый источник правды — драйвер)"""
+        return self.driver.is_connected if self.driver else False
+
     def connect(self) -> bool:
         """
         Подключение к устройству
@@ -136,18 +199,46 @@ class DeviceClient:
             ConnectionError: Если не удалось подключиться
         """
         try:
-            self.is_connected = self.driver.connect()
+            self.driver.connect()
+            if self.is_connected:
+                # Специализация горячего пути: пока соединение активно,
+                # геттеры делегируют драйверу напрямую, без повторной
+                # проверки is_connected на каждый вызов (исход проверки
+                # постоянен между connect и disconnect)
+                self.get_voltage = self.driver.get_voltage
+                self.get_current = self.driver.get_current
+                self.get_serial = self.driver.get_serial
             return self.is_connected
         except Exception as e:
             raise ConnectionError(f"Ошибка подключения: {e}")
-    
+
     def disconnect(self):
         """Отключение от устройства"""
-        if self.driver and hasattr(self.driver, 'disconnect'):
+        # Возвращаем геттеры класса, которые проверяют is_connected
+        for name in ('get_voltage', 'get_current', 'get_serial'):
+            self.__dict__.pop(name, None)
+        if self.driver is not None:
             self.driver.disconnect()
-        self.is_connected = False
         logger.info("Отключено от устройства")
     
+    def _now_iso(self) -> str:
+        """
+        Текущее время в формате ISO 8601 (аналог datetime.now().isoformat())
+
+        Секундная часть форматируется strftime максимум один раз в
+        секунду и кэшируется, микросекунды дописываются целочисленной
+        арифметикой — без создания объекта datetime на каждый вызов.
+
+        Returns:
+            str: Метка времени вида "2024-01-01T12:00:00.123456"
+        """
+        t = time.time()
+        sec = int(t)
+        if sec != self._last_sec:
+            self._last_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+            self._last_sec = sec
+        return f'{self._last_prefix}.{int((t - sec) * 1_000_000):06d}'
+
     def get_reading(self) -> DeviceReading:
         """
         Получить все показания от устройства
@@ -162,26 +253,24 @@ class DeviceClient:
             raise ConnectionError("Устройство не подключено")
         
         try:
-            # Получаем все показания
-            voltage = self.driver.get_voltage()
-            current = self.driver.get_current()
-            serial = self.driver.get_serial()
-            
+            # Получаем все показания одним пакетным запросом (один RTT вместо трёх)
+            voltage, current, serial = self.driver.get_triplet()
+
             # Создаем объект показаний
             reading = DeviceReading(
-                timestamp=datetime.now().isoformat(),
+                timestamp=self._now_iso(),
                 voltage=voltage,
                 current=current,
                 serial=serial,
                 status="OK"
             )
             
-            logger.debug(f"Получены показания: {reading}")
+            logger.debug("Получены показания: %s", reading)
             return reading
             
         except Exception as e:
             # ВСЕГДА выбрасываем исключение при ошибке
-            logger.error(f"КРИТИЧЕСКАЯ ОШИБКА устройства: {e}")
+            logger.error("КРИТИЧЕСКАЯ ОШИБКА устройства: %s", e)
             raise DeviceError(f"Ошибка устройства: {e}")
     
     def get_voltage(self) -> str:
@@ -202,6 +291,69 @@ class DeviceClient:
             raise ConnectionError("Устройство не подключено")
         return self.driver.get_serial()
     
+    def stream_readings(self, hz: float, callback) -> None:
+        """
+        Поток показаний с фиксированной частотой для high-rate опроса
+
+        Оптимизации горячего цикла:
+        - один переиспользуемый экземпляр DeviceReading: поля
+          перезаписываются на каждом такте, поэтому в callback нужно
+          копировать значения, а не сохранять ссылку на объект;
+        - расписание по абсолютным меткам time.monotonic() — частота
+          не дрейфует из-за длительности самого запроса;
+        - метка времени через кэшированный _now_iso (без datetime).
+
+        Опрос продолжается, пока callback не вернет False.
+
+        Args:
+            hz: Частота опроса (запросов в секунду)
+            callback: Функция, получающая DeviceReading; вернуть False
+                для остановки потока
+
+        Raises:
+            ConnectionError: Если устройство не подключено
+        """
+        if not self.is_connected:
+            raise ConnectionError("Устройство не подключено")
+
+        # Все горячие ссылки поднимаем в локальные переменные
+        reading = DeviceReading(timestamp='', voltage='', current='', serial='')
+        get_triplet = self.driver.get_triplet
+        now_iso = self._now_iso
+        monotonic = time.monotonic
+        sleep = time.sleep
+
+        period = 1.0 / hz
+        next_t = monotonic()
+
+        while True:
+            now = monotonic()
+            if now < next_t:
+                sleep(next_t - now)
+            next_t += period
+            # Если такт сильно отстал — не устраиваем шторм догоняющих циклов
+            if next_t < monotonic():
+                next_t = monotonic() + period
+
+            try:
+                v, a, s = get_triplet()
+                reading.voltage = v
+                reading.current = a
+                reading.serial = s
+                reading.status = "OK"
+                reading.error = None
+            except DeviceError as e:
+                # Константные поля берем из готового шаблона
+                reading.voltage = _ERROR_TEMPLATE.voltage
+                reading.current = _ERROR_TEMPLATE.current
+                reading.serial = _ERROR_TEMPLATE.serial
+                reading.status = _ERROR_TEMPLATE.status
+                reading.error = str(e)
+            reading.timestamp = now_iso()
+
+            if callback(reading) is False:
+                break
+
     def test_connection(self) -> bool:
         """
         Тестирование соединения с устройством
@@ -218,7 +370,7 @@ class DeviceClient:
             return serial.startswith("S_")
             
         except Exception as e:
-            logger.warning(f"Тест соединения провален: {e}")
+            logger.warning("Тест соединения провален: %s", e)
             return False
         finally:
             if self.is_connected:
@@ -232,6 +384,12 @@ class DeviceClient:
         self.disconnect()
 
 
+@lru_cache(maxsize=64)
+def _config_from_items(items: tuple) -> DeviceConfig:
+    """Мемоизированная сборка DeviceConfig из замороженного вида словаря"""
+    return DeviceConfig.from_dict(dict(items))
+
+
 # Функция для удобного импорта
 def create_device_client(config_dict: Dict[str, Any]) -> DeviceClient:
     """
@@ -251,7 +409,12 @@ def create_device_client(config_dict: Dict[str, Any]) -> DeviceClient:
         >>> }
         >>> device = create_device_client(config)
     """
-    config = DeviceConfig.from_dict(config_dict)
+    # Повторные вызовы с одинаковым конфигом (тесты, оркестрация) получают
+    # уже собранный DeviceConfig из кэша; нехэшируемые значения — обычный путь
+    try:
+        config = _config_from_items(tuple(sorted(config_dict.items())))
+    except TypeError:
+        config = DeviceConfig.from_dict(dict(config_dict))
     return DeviceClient(config)
 
 
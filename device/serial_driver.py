@@ -15,7 +15,19 @@ class SerialDriver:
     """
     Драйвер для работы с устройством по Serial (COM порт)
     """
-    
+
+    # Фиксированный набор атрибутов: доступ через слоты быстрее
+    # словарного и вдвое экономит память на экземпляр
+    __slots__ = ('port', 'baudrate', 'timeout', 'serial_conn', 'is_connected')
+
+    # Предвычисленные байтовые команды с CR/LF:
+    # без f-string и encode на каждую отправку
+    _CMD_BYTES = {
+        'GET_V': b'GET_V\r\n',
+        'GET_A': b'GET_A\r\n',
+        'GET_S': b'GET_S\r\n',
+    }
+
     def __init__(self, port: str = "/dev/ttyACM0", baudrate: int = 115200, timeout: float = 1.0):
         self.port = port
         self.baudrate = baudrate
@@ -23,12 +35,12 @@ class SerialDriver:
         self.serial_conn: Optional[serial.Serial] = None
         self.is_connected = False
         
-        logger.debug(f"Serial драйвер инициализирован: {port}@{baudrate}")
+        logger.debug("Serial драйвер инициализирован: %s@%s", port, baudrate)
     
     def connect(self) -> bool:
         """Подключение к устройству по Serial"""
         try:
-            logger.info(f"Подключение к устройству по Serial: {self.port}@{self.baudrate}")
+            logger.info("Подключение к устройству по Serial: %s@%s", self.port, self.baudrate)
             
             # Добавляем /dev/ если не указано
             port_path = self.port if self.port.startswith('/dev/') else f"/dev/{self.port}"
@@ -44,41 +56,96 @@ class SerialDriver:
                 rtscts=False,
                 dsrdtr=False
             )
-            
-            # Даем время на инициализацию
-            time.sleep(2)
-            
-            # Очищаем буфер
-            if self.serial_conn.in_waiting:
-                self.serial_conn.read(self.serial_conn.in_waiting)
-            
+
+            # Включаем режим низкой задержки на уровне драйвера ядра:
+            # у FTDI/CDC-ACM по умолчанию таймер буферизации 16 мс,
+            # ASYNC_LOW_LATENCY снижает его до 1 мс
+            self._set_low_latency()
+
+            # Ждем готовности устройства, но не фиксированные 2 секунды:
+            # опрашиваем его собственным протоколом и выходим сразу,
+            # как только пришел валидный ответ (обычно 50-200 мс)
+            self._wait_ready(deadline=2.0)
+
             self.is_connected = True
-            logger.info(f"Успешно подключено к {self.port}")
+            logger.info("Успешно подключено к %s", self.port)
             return True
             
         except serial.SerialException as e:
-            logger.error(f"Ошибка подключения к {self.port}: {e}")
+            logger.error("Ошибка подключения к %s: %s", self.port, e)
             raise ConnectionError(f"Не удалось подключиться к {self.port}: {e}")
         except Exception as e:
-            logger.error(f"Неожиданная ошибка при подключении: {e}")
+            logger.error("Неожиданная ошибка при подключении: %s", e)
             raise ConnectionError(f"Ошибка подключения: {e}")
     
+    def _wait_ready(self, deadline: float = 2.0):
+        """
+        Ожидание готовности устройства после открытия порта
+
+        CDC-ACM устройства (Arduino и подобные) перезагружаются при
+        открытии порта. Вместо фиксированной паузы посылаем GET_S и
+        ждем валидный ответ — готовность определяет сам протокол.
+
+        Args:
+            deadline: Максимальное время ожидания (секунды)
+        """
+        limit = time.monotonic() + deadline
+        while time.monotonic() < limit:
+            try:
+                self.serial_conn.reset_input_buffer()
+                self.serial_conn.write(b"GET_S\r\n")
+                self.serial_conn.flush()
+                response = self.serial_conn.readline()
+                if response.startswith(b"S_"):
+                    logger.debug("Устройство %s готово", self.port)
+                    return
+            except serial.SerialException:
+                pass
+            time.sleep(0.05)
+
+        logger.warning("Устройство %s не подтвердило готовность за %s с", self.port, deadline)
+
+    def _set_low_latency(self):
+        """
+        Установка флага ASYNC_LOW_LATENCY через ioctl TIOCSSERIAL
+
+        Снижает таймер коалесинга USB-serial драйвера с 16 мс до 1 мс,
+        что сокращает RTT каждой команды. На не-Linux системах и портах,
+        не поддерживающих ioctl, просто пропускаем (это оптимизация,
+        а не обязательное условие работы).
+        """
+        TIOCGSERIAL = 0x541E
+        TIOCSSERIAL = 0x541F
+        ASYNC_LOW_LATENCY = 0x2000
+
+        try:
+            import fcntl
+            import struct
+
+            fd = self.serial_conn.fileno()
+            buf = bytearray(0x48)
+            fcntl.ioctl(fd, TIOCGSERIAL, buf, True)
+            flags = struct.unpack_from('i', buf, 28)[0] | ASYNC_LOW_LATENCY
+            struct.pack_into('i', buf, 28, flags)
+            fcntl.ioctl(fd, TIOCSSERIAL, buf)
+            logger.debug("Режим низкой задержки включен для %s", self.port)
+        except (ImportError, OSError) as e:
+            logger.debug("Режим низкой задержки недоступен для %s: %s", self.port, e)
+
     def _send_command(self, command: str) -> str:
         """Отправка команды и получение ответа"""
         if not self.is_connected or not self.serial_conn:
             raise ConnectionError("Устройство не подключено")
         
         try:
-            # Очищаем буфер перед отправкой
-            if self.serial_conn.in_waiting:
-                self.serial_conn.read(self.serial_conn.in_waiting)
-            
-            # Отправляем команду
-            cmd_bytes = f"{command}\r\n".encode('utf-8')
-            self.serial_conn.write(cmd_bytes)
-            self.serial_conn.flush()
-            
-            logger.debug(f"Отправлена команда: {command}")
+            # Очищаем буфер перед отправкой одним syscall (TCFLUSH)
+            # вместо пары in_waiting + read
+            self.serial_conn.reset_input_buffer()
+
+            # Отправляем команду одним write готового буфера
+            self.serial_conn.write(self._CMD_BYTES[command])
+
+            logger.debug("Отправлена команда: %s", command)
             
             # Читаем ответ
             response = self.serial_conn.readline().decode('utf-8', errors='ignore').strip()
@@ -88,15 +155,15 @@ class SerialDriver:
                 time.sleep(0.1)
                 response = self.serial_conn.readline().decode('utf-8', errors='ignore').strip()
             
-            logger.debug(f"Получен ответ: {response}")
+            logger.debug("Получен ответ: %s", response)
             return response
             
         except serial.SerialException as e:
-            logger.error(f"Ошибка связи с устройством: {e}")
+            logger.error("Ошибка связи с устройством: %s", e)
             self.is_connected = False
             raise DeviceError(f"Ошибка связи: {e}")
         except Exception as e:
-            logger.error(f"Ошибка при отправке команды {command}: {e}")
+            logger.error("Ошибка при отправке команды %s: %s", command, e)
             raise DeviceError(f"Ошибка выполнения команды: {e}")
     
     def get_voltage(self) -> str:
@@ -133,6 +200,50 @@ class SerialDriver:
         except Exception as e:
             raise DeviceError(f"Ошибка получения серийного номера: {e}")
     
+    def get_triplet(self) -> tuple:
+        """
+        Получение всех трёх показаний за один проход
+
+        Все команды пишутся в порт подряд, затем читаются три ответа —
+        задержки устройства на соседних командах перекрываются вместо
+        трёх последовательных обменов запрос-ответ. Ответы различаются
+        по префиксу (V_/A_/S_), порядок прихода не важен.
+
+        Returns:
+            tuple: (напряжение, ток, серийный номер)
+
+        Raises:
+            ConnectionError: Если устройство не подключено
+            DeviceError: Если произошла ошибка связи или протокола
+        """
+        if not self.is_connected or not self.serial_conn:
+            raise ConnectionError("Устройство не подключено")
+
+        try:
+            # Сбрасываем возможный мусор и пишем все команды подряд
+            self.serial_conn.reset_input_buffer()
+            for cmd in ('GET_V', 'GET_A', 'GET_S'):
+                self.serial_conn.write(self._CMD_BYTES[cmd])
+
+            results = {}
+            for _ in range(3):
+                response = self.serial_conn.readline().decode('utf-8', errors='ignore').strip()
+                prefix = response[:2]
+                if prefix in ('V_', 'A_', 'S_'):
+                    results[prefix] = response
+                else:
+                    raise DeviceError(f"Неверный формат ответа: {response}")
+
+            return (results['V_'], results['A_'], results['S_'])
+
+        except serial.SerialException as e:
+            logger.error("Ошибка связи с устройством: %s", e)
+            self.is_connected = False
+            raise DeviceError(f"Ошибка связи: {e}")
+
+    # Совместимое имя пакетного интерфейса (см. UDPDriver.get_all)
+    get_all = get_triplet
+
     def get_all_metrics(self) -> dict:
         """Получение всех метрик за один запрос"""
         try:
@@ -155,9 +266,9 @@ class SerialDriver:
             try:
                 self.serial_conn.close()
                 self.is_connected = False
-                logger.info(f"Отключено от {self.port}")
+                logger.info("Отключено от %s", self.port)
             except Exception as e:
-                logger.error(f"Ошибка при отключении: {e}")
+                logger.error("Ошибка при отключении: %s", e)
     
     def __del__(self):
         """Деструктор для корректного закрытия соединения"""
@@ -3,6 +3,13 @@
 UDP драйвер для работы с устройством
 """
 
+import atexit
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import selectors
 import socket
 import time
 from typing import Optional, Tuple
@@ -11,16 +18,72 @@ from .exceptions import ConnectionError, TimeoutError, ProtocolError
 
 logger = logging.getLogger(__name__)
 
+
+# ---------------------------------------------------------------------------
+# Пакетные syscall'ы sendmmsg/recvmmsg (Linux): одна граница ядра на всю
+# пачку датаграмм вместо пары syscall'ов на каждую. stdlib их не экспортирует,
+# поэтому привязываемся к libc через ctypes; если привязка недоступна,
+# конвейерный режим работает обычными send/recv.
+# ---------------------------------------------------------------------------
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_IOVec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr),
+                ('msg_len', ctypes.c_uint)]
+
+
+def _load_libc():
+    """Привязка sendmmsg/recvmmsg из libc (None если недоступны)"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6',
+                           use_errno=True)
+        libc.sendmmsg
+        libc.recvmmsg
+        return libc
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+_LIBC = _load_libc()
+
+
+# Предвычисленные байтовые команды и ожидаемые префиксы ответов:
+# кодирование и сборка префикса не выполняются на горячем пути
+_CMD_V = b"GET_V"
+_CMD_A = b"GET_A"
+_CMD_S = b"GET_S"
+_CMD_ALL = b"GET_ALL"
+_PREFIX = {_CMD_V: b"V_", _CMD_A: b"A_", _CMD_S: b"S_"}
+
 class UDPDriver:
     """
     Драйвер для работы с устройством по UDP
     
     Устройство ожидает команды и отвечает на них:
     - Запрос: "GET_V" → Ответ: "V_12V"
-    - Запрос: "GET_A" → Ответ: "A_1A"  
+    - Запрос: "GET_A" → Ответ: "A_1A"
     - Запрос: "GET_S" → Ответ: "S_DSA123"
     """
-    
+
+    # Фиксированный набор атрибутов: доступ через слоты быстрее
+    # словарного и вдвое экономит память на экземпляр
+    __slots__ = ('host', 'port', 'timeout', 'socket', 'is_connected',
+                 '_rxbuf', '_rxview')
+
     def __init__(self, host: str = "127.0.0.1", port: int = 10000, timeout: float = 5.0):
         """
         Инициализация UDP драйвера
@@ -35,8 +98,13 @@ class UDPDriver:
         self.timeout = timeout
         self.socket: Optional[socket.socket] = None
         self.is_connected = False
-        
-        logger.debug(f"UDP драйвер инициализирован: {host}:{port}")
+
+        # Один приёмный буфер на весь драйвер: recv_into не выделяет
+        # новый объект bytes на каждый пакет в отличие от recvfrom
+        self._rxbuf = bytearray(1500)
+        self._rxview = memoryview(self._rxbuf)
+
+        logger.debug("UDP драйвер инициализирован: %s:%s", host, port)
     
     def connect(self) -> bool:
         """
@@ -52,57 +120,77 @@ class UDPDriver:
             # Создаем сокет
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.socket.settimeout(self.timeout)
+            self._tune_socket()
+
+            # Привязываем адрес устройства один раз: дальше send/recv
+            # вместо sendto/recvfrom, без копирования адреса на каждый пакет
+            self.socket.connect((self.host, self.port))
             
             # Для UDP подключение тестовое - просто проверяем доступность
             # Устанавливаем флаг подключения перед тестовым запросом
             self.is_connected = True
             
-            logger.info(f"Попытка подключения к устройству {self.host}:{self.port}")
+            logger.info("Попытка подключения к устройству %s:%s", self.host, self.port)
             
             # Тестовый запрос для проверки соединения
             # Используем отдельный метод для тестового запроса без проверки is_connected
             try:
                 # Отправляем тестовую команду
-                self.socket.sendto(b"GET_S", (self.host, self.port))
+                self.socket.send(_CMD_S)
                 
                 # Получаем ответ
-                data, addr = self.socket.recvfrom(1024)
-                test_response = data.decode('utf-8', errors='ignore').strip()
+                test_response = self._recv().decode('utf-8', errors='ignore')
                 
-                logger.debug(f"Тестовый ответ от устройства: {test_response}")
+                logger.debug("Тестовый ответ от устройства: %s", test_response)
                 
                 if test_response and test_response.startswith("S_"):
-                    logger.info(f"Успешно подключено к устройству {self.host}:{self.port}")
+                    logger.info("Успешно подключено к устройству %s:%s", self.host, self.port)
+                    # Страховка на случай выхода без явного disconnect;
+                    # снимается в disconnect()
+                    atexit.register(self.disconnect)
                     return True
                 else:
                     self.is_connected = False
-                    logger.error(f"Неверный формат тестового ответа: {test_response}")
+                    logger.error("Неверный формат тестового ответа: %s", test_response)
                     raise ConnectionError(f"Неверный ответ от устройства: {test_response}")
                     
             except socket.timeout:
                 self.is_connected = False
-                logger.error(f"Таймаут при тестовом запросе к {self.host}:{self.port}")
+                logger.error("Таймаут при тестовом запросе к %s:%s", self.host, self.port)
                 raise ConnectionError(f"Таймаут подключения к {self.host}:{self.port}")
             except Exception as e:
                 self.is_connected = False
-                logger.error(f"Ошибка при тестовом запросе: {e}")
+                logger.error("Ошибка при тестовом запросе: %s", e)
                 raise ConnectionError(f"Ошибка тестового запроса: {e}")
                 
         except socket.timeout:
             self.is_connected = False
-            logger.error(f"Таймаут создания сокета для {self.host}:{self.port}")
+            logger.error("Таймаут создания сокета для %s:%s", self.host, self.port)
             raise TimeoutError(f"Таймаут подключения к {self.host}:{self.port}")
         except Exception as e:
             self.is_connected = False
-            logger.error(f"Ошибка создания сокета: {e}")
+            logger.error("Ошибка создания сокета: %s", e)
             raise ConnectionError(f"Ошибка подключения: {e}")
     
-    def _send_command(self, command: str) -> str:
+    def _recv(self) -> bytes:
+        """
+        Приём одной датаграммы в предвыделенный буфер
+
+        Адрес отправителя нигде не используется, поэтому recvfrom
+        (новый bytes + кортеж адреса на каждый пакет) не нужен.
+
+        Returns:
+            bytes: Принятые данные без хвостовых пробельных байт
+        """
+        n = self.socket.recv_into(self._rxbuf)
+        return bytes(self._rxview[:n]).strip()
+
+    def _send_command(self, command: bytes) -> str:
         """
         Отправка команды устройству и получение ответа
-        
+
         Args:
-            command: Команда для отправки
+            command: Байтовая команда для отправки (_CMD_V/_CMD_A/_CMD_S)
             
         Returns:
             str: Ответ от устройства
@@ -114,86 +202,305 @@ class UDPDriver:
         """
         if not self.socket:
             raise ConnectionError("Сокет не инициализирован")
-        
+
         if not self.is_connected:
             raise ConnectionError("Устройство не подключено")
-        
+
         try:
-            # Отправка команды
-            self.socket.sendto(command.encode('utf-8'), (self.host, self.port))
-            logger.debug(f"Отправлена команда: {command}")
-            
+            # Отправка команды (байты предвычислены, без encode на каждый вызов)
+            self.socket.send(command)
+            logger.debug("Отправлена команда: %s", command)
+
             # Получение ответа
-            data, addr = self.socket.recvfrom(1024)
-            response = data.decode('utf-8', errors='ignore').strip()
-            
-            logger.debug(f"Получен ответ: {response} от {addr}")
-            
-            # Проверка формата ответа
-            if not self._validate_response(command, response):
-                logger.warning(f"Неверный формат ответа для команды {command}: {response}")
-                raise ProtocolError(f"Неверный формат ответа: {response}")
-            
+            data = self._recv()
+
+            # Проверка формата на сырых байтах: GET_V → V_, GET_A → A_, GET_S → S_
+            # Декодируем в str только валидный ответ
+            if not data.startswith(_PREFIX[command]):
+                logger.warning("Неверный формат ответа для команды %s: %r", command, data)
+                raise ProtocolError(f"Неверный формат ответа: {data!r}")
+
+            response = data.decode('utf-8', errors='ignore')
+            logger.debug("Получен ответ: %s", response)
+
             return response
-            
+
         except socket.timeout:
-            logger.error(f"Таймаут при выполнении команды: {command}")
+            logger.error("Таймаут при выполнении команды: %s", command)
             raise TimeoutError(f"Таймаут при выполнении команды: {command}")
-        except UnicodeDecodeError:
-            logger.error(f"Невозможно декодировать ответ от устройства")
-            raise ProtocolError(f"Невозможно декодировать ответ от устройства")
+        except ProtocolError:
+            raise
         except Exception as e:
-            logger.error(f"Ошибка при отправке команды {command}: {e}")
+            logger.error("Ошибка при отправке команды %s: %s", command, e)
             # Помечаем соединение как разорванное
             self.is_connected = False
             raise ConnectionError(f"Ошибка связи: {e}")
-    
-    def _validate_response(self, command: str, response: str) -> bool:
+
+    def get_all(self) -> tuple:
         """
-        Валидация ответа от устройства
-        
+        Получить все показания за один обмен с устройством
+
+        Отправляет одну команду "GET_ALL" и ожидает ответ вида
+        "V_12V;A_1A;S_DSA123" — одна пара send/recv вместо трёх.
+        Если устройство не поддерживает GET_ALL, переходим на
+        конвейерный режим: сначала отправляем все три команды,
+        потом читаем три ответа (сетевые задержки перекрываются).
+
+        Returns:
+            tuple: (напряжение, ток, серийный номер)
+
+        Raises:
+            ConnectionError: Если устройство не подключено
+            TimeoutError: Если превышен таймаут
+            ProtocolError: Если ответ в неверном формате
+        """
+        if not self.socket or not self.is_connected:
+            raise ConnectionError("Устройство не подключено")
+
+        try:
+            # Одна команда — один ответ со всеми показаниями
+            self.socket.send(_CMD_ALL)
+            response = self._recv().decode('utf-8', errors='ignore')
+
+            logger.debug("Получен ответ GET_ALL: %s", response)
+
+            parts = response.split(';')
+            if (len(parts) == 3 and parts[0].startswith("V_")
+                    and parts[1].startswith("A_") and parts[2].startswith("S_")):
+                return tuple(parts)
+
+            # Устройство не поддерживает GET_ALL — пробуем фреймы
+            logger.debug("GET_ALL не поддерживается устройством, фреймированный режим")
+            return self.get_batch((_CMD_V, _CMD_A, _CMD_S))
+
+        except socket.timeout:
+            logger.error("Таймаут при выполнении команды GET_ALL")
+            raise TimeoutError("Таймаут при выполнении команды GET_ALL")
+        except (ProtocolError, TimeoutError):
+            raise
+        except Exception as e:
+            logger.error("Ошибка при пакетном запросе показаний: %s", e)
+            self.is_connected = False
+            raise ConnectionError(f"Ошибка связи: {e}")
+
+    def get_batch(self, commands) -> tuple:
+        """
+        Отправка нескольких команд одной датаграммой
+
+        Команды упаковываются в один пакет с разделителем "\\n",
+        ответ приходит одной датаграммой в том же порядке — одна
+        пара syscall'ов send/recv вместо пары на каждую команду.
+        Если устройство не поддерживает фреймы, стандартная тройка
+        команд выполняется конвейером.
+
         Args:
-            command: Отправленная команда
-            response: Полученный ответ
-            
+            commands: Последовательность байтовых команд (_CMD_V, _CMD_A, ...)
+
         Returns:
-            bool: True если ответ валиден
+            tuple: Ответы в порядке команд
+
+        Raises:
+            ConnectionError: Если устройство не подключено
+            TimeoutError: Если превышен таймаут
+            ProtocolError: Если ответ в неверном формате
         """
-        if not response:
-            return False
-            
+        if not self.socket or not self.is_connected:
+            raise ConnectionError("Устройство не подключено")
+
+        cmds = tuple(commands)
+        frame = b'\n'.join(cmds) + b'\n'
+
         try:
-            # Устройство всегда отвечает в формате:
-            # GET_V → V_<значение>
-            # GET_A → A_<значение>
-            # GET_S → S_<значение>
-            
-            # Извлекаем префикс из команды: GET_V → V
-            parts = command.split('_')
-            if len(parts) < 2:
-                return False
-                
-            expected_prefix = parts[1]  # GET_V → V
-            
-            # Проверяем, что ответ начинается с правильного префикса
-            return response.startswith(f"{expected_prefix}_")
-            
-        except Exception:
-            return False
-    
+            self.socket.send(frame)
+            logger.debug("Отправлен пакет команд: %s", cmds)
+
+            data = self._recv()
+            tokens = [t.strip() for t in data.split(b'\n') if t.strip()]
+
+            if (len(tokens) == len(cmds)
+                    and all(t.startswith(_PREFIX[c])
+                            for c, t in zip(cmds, tokens))):
+                return tuple(t.decode('utf-8', errors='ignore') for t in tokens)
+
+            # Фреймы не поддерживаются — для стандартной тройки есть конвейер
+            if cmds == (_CMD_V, _CMD_A, _CMD_S):
+                logger.debug("Фреймы не поддерживаются устройством, конвейерный режим")
+                return self._pipeline_all()
+
+            raise ProtocolError(f"Неверный формат пакетного ответа: {data!r}")
+
+        except socket.timeout:
+            logger.error("Таймаут при выполнении пакета команд: %s", cmds)
+            raise TimeoutError(f"Таймаут при выполнении пакета команд: {cmds}")
+        except (ProtocolError, TimeoutError):
+            raise
+        except Exception as e:
+            logger.error("Ошибка при пакетной отправке команд: %s", e)
+            self.is_connected = False
+            raise ConnectionError(f"Ошибка связи: {e}")
+
+    def _pipeline_all(self) -> tuple:
+        """
+        Конвейерный запрос трёх показаний
+
+        Отправляет GET_V, GET_A, GET_S подряд, затем читает три
+        ответа. На Linux пачка уходит и приходит одной парой
+        syscall'ов sendmmsg/recvmmsg, иначе — обычные send/recv.
+        Ответы различаются по префиксу (V_/A_/S_), поэтому порядок
+        прихода не важен.
+
+        Returns:
+            tuple: (напряжение, ток, серийный номер)
+        """
+        if _LIBC is not None:
+            replies = self._exchange_mmsg((_CMD_V, _CMD_A, _CMD_S))
+            results = {}
+            for data in replies:
+                response = data.decode('utf-8', errors='ignore')
+                prefix = response[:2]
+                if prefix in ("V_", "A_", "S_"):
+                    results[prefix] = response
+                else:
+                    raise ProtocolError(f"Неверный формат ответа: {response}")
+
+            if len(results) != 3:
+                raise ProtocolError(f"Получены не все показания: {sorted(results)}")
+        else:
+            results = self.get_all_async()
+
+        return (results["V_"], results["A_"], results["S_"])
+
+    def get_all_async(self) -> dict:
+        """
+        Неблокирующий сбор трёх показаний через selectors
+
+        Все три команды отправляются подряд, затем ответы собираются
+        одним циклом ожидания готовности сокета — задержки устройства
+        на соседних командах перекрываются, а общий дедлайн ограничен
+        self.timeout на весь сбор. Ответы сопоставляются по префиксу
+        (V_/A_/S_), порядок прихода не важен.
+
+        Returns:
+            dict: {"V_": ..., "A_": ..., "S_": ...}
+
+        Raises:
+            ConnectionError: Если устройство не подключено
+            TimeoutError: Если показания не собраны за self.timeout
+            ProtocolError: Если ответ в неверном формате
+        """
+        if not self.socket or not self.is_connected:
+            raise ConnectionError("Устройство не подключено")
+
+        for command in (_CMD_V, _CMD_A, _CMD_S):
+            self.socket.send(command)
+
+        results = {}
+        sel = selectors.DefaultSelector()
+        sel.register(self.socket, selectors.EVENT_READ)
+        try:
+            deadline = time.monotonic() + self.timeout
+            while len(results) < 3:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not sel.select(remaining):
+                    raise TimeoutError(
+                        f"Таймаут при сборе показаний, получено: {sorted(results)}")
+
+                response = self._recv().decode('utf-8', errors='ignore')
+                prefix = response[:2]
+                if prefix in ("V_", "A_", "S_"):
+                    results[prefix] = response
+                else:
+                    raise ProtocolError(f"Неверный формат ответа: {response}")
+        finally:
+            sel.close()
+
+        return results
+
+    def _exchange_mmsg(self, commands) -> list:
+        """
+        Обмен пачкой датаграмм через sendmmsg/recvmmsg
+
+        Вся отправка — один syscall; прием — по одному recvmmsg на
+        готовность сокета (обычно тоже один). Сокет в режиме таймаута
+        неблокирующий, поэтому готовность ждем через select.
+
+        Args:
+            commands: Байтовые команды для отправки
+
+        Returns:
+            list: Принятые датаграммы (bytes, без хвостовых пробелов)
+
+        Raises:
+            socket.timeout: Если ответы не пришли за self.timeout
+            OSError: При ошибке syscall'а
+        """
+        fd = self.socket.fileno()
+        n = len(commands)
+
+        # Отправка: по одному iovec на команду, один вызов sendmmsg
+        sbufs = [ctypes.create_string_buffer(cmd, len(cmd)) for cmd in commands]
+        siovs = (_IOVec * n)()
+        smsgs = (_MMsgHdr * n)()
+        for i in range(n):
+            siovs[i].iov_base = ctypes.cast(sbufs[i], ctypes.c_void_p)
+            siovs[i].iov_len = len(commands[i])
+            smsgs[i].msg_hdr.msg_iov = ctypes.pointer(siovs[i])
+            smsgs[i].msg_hdr.msg_iovlen = 1
+
+        sent = _LIBC.sendmmsg(fd, smsgs, n, 0)
+        if sent != n:
+            err = ctypes.get_errno()
+            raise OSError(err, f"sendmmsg: {os.strerror(err)}")
+
+        # Прием: собираем n датаграмм до истечения таймаута
+        replies = []
+        deadline = time.monotonic() + self.timeout
+        while len(replies) < n:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("timed out")
+            ready, _, _ = select.select([self.socket], [], [], remaining)
+            if not ready:
+                raise socket.timeout("timed out")
+
+            k = n - len(replies)
+            rbufs = [ctypes.create_string_buffer(1500) for _ in range(k)]
+            riovs = (_IOVec * k)()
+            rmsgs = (_MMsgHdr * k)()
+            for i in range(k):
+                riovs[i].iov_base = ctypes.cast(rbufs[i], ctypes.c_void_p)
+                riovs[i].iov_len = 1500
+                rmsgs[i].msg_hdr.msg_iov = ctypes.pointer(riovs[i])
+                rmsgs[i].msg_hdr.msg_iovlen = 1
+
+            got = _LIBC.recvmmsg(fd, rmsgs, k, 0, None)
+            if got < 0:
+                err = ctypes.get_errno()
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                    continue
+                raise OSError(err, f"recvmmsg: {os.strerror(err)}")
+
+            for i in range(got):
+                replies.append(rbufs[i].raw[:rmsgs[i].msg_len].strip())
+
+        return replies
+
+    # Совместимое имя пакетного интерфейса (см. SerialDriver.get_triplet)
+    get_triplet = get_all
+
     def get_voltage(self) -> str:
         """
         Получить напряжение от устройства
-        
+
         Returns:
             str: Значение напряжения (например, "V_12V")
-            
+
         Raises:
             ConnectionError: Если устройство не подключено
             DeviceError: Если произошла ошибка
         """
         try:
-            return self._send_command("GET_V")
+            return self._send_command(_CMD_V)
         except Exception as e:
             # Преобразуем исключения в DeviceError для единообразия
             from .exceptions import DeviceError
@@ -211,7 +518,7 @@ class UDPDriver:
             DeviceError: Если произошла ошибка
         """
         try:
-            return self._send_command("GET_A")
+            return self._send_command(_CMD_A)
         except Exception as e:
             from .exceptions import DeviceError
             raise DeviceError(f"Ошибка получения тока: {e}")
@@ -228,24 +535,65 @@ class UDPDriver:
             DeviceError: Если произошла ошибка
         """
         try:
-            return self._send_command("GET_S")
+            return self._send_command(_CMD_S)
         except Exception as e:
             from .exceptions import DeviceError
             raise DeviceError(f"Ошибка получения серийного номера: {e}")
     
+    def _tune_socket(self):
+        """
+        Тюнинг параметров сокета
+
+        Буферы приема/отправки поднимаются до 2 МиБ: при всплесках
+        ответов или опросе нескольких устройств дефолтные ~208 КиБ
+        переполняются, пакеты дропаются и превращаются в таймауты.
+        SO_REUSEPORT позволяет запустить несколько шардов монитора за
+        одним портом, IP_MTU_DISCOVER=DO исключает фрагментацию датаграмм.
+        Все опции опциональны: отказ любой из них не мешает работе.
+        """
+        bufsize = 2 << 20
+
+        for opt in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, opt, bufsize)
+            except OSError as e:
+                logger.debug("Не удалось установить буфер сокета: %s", e)
+
+        if hasattr(socket, 'SO_REUSEPORT'):
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError as e:
+                logger.debug("SO_REUSEPORT недоступен: %s", e)
+
+        if hasattr(socket, 'IP_MTU_DISCOVER'):
+            try:
+                self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MTU_DISCOVER,
+                                       socket.IP_PMTUDISC_DO)
+            except OSError as e:
+                logger.debug("IP_MTU_DISCOVER недоступен: %s", e)
+
+        # Эффективные размеры (ядро может удвоить или ограничить их)
+        logger.debug(
+            "Буферы сокета: rcv=%s snd=%s",
+            self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+            self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+        )
+
     def disconnect(self):
         """Отключение от устройства"""
+        atexit.unregister(self.disconnect)
+
         if self.socket:
             try:
                 self.socket.close()
-                logger.debug(f"Сокет закрыт для {self.host}:{self.port}")
+                logger.debug("Сокет закрыт для %s:%s", self.host, self.port)
             except Exception as e:
-                logger.warning(f"Ошибка при закрытии сокета: {e}")
+                logger.warning("Ошибка при закрытии сокета: %s", e)
             finally:
                 self.socket = None
         
         self.is_connected = False
-        logger.info(f"Отключено от устройства {self.host}:{self.port}")
+        logger.info("Отключено от устройства %s:%s", self.host, self.port)
     
     def __enter__(self):
         """Поддержка контекстного менеджера"""
@@ -255,7 +603,8 @@ class UDPDriver:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Завершение контекстного менеджера"""
         self.disconnect()
-    
-    def __del__(self):
-        """Деструктор для корректного закрытия соединения"""
-        self.disconnect()
\ No newline at end of file
+
+    # __del__ намеренно отсутствует: финализатор тянет экземпляры через
+    # циклический сборщик и ненадежен при остановке интерпретатора
+    # (глобальные модули могут быть уже None). Закрытие гарантируют
+    # явный disconnect(), контекстный менеджер и atexit-страховка
\ No newline at end of file
@@ -17,19 +17,37 @@ import time
 import signal
 import logging
 import json
+import struct
+import asyncio
 from datetime import datetime
 from typing import Dict, Any
+import pickle
 import yaml
 from pathlib import Path
 
+# C-загрузчик YAML (libyaml) на порядок быстрее чистопитоновского;
+# при сборке PyYAML без libyaml откатываемся на SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# msgpack — опциональная зависимость для бинарного формата лога;
+# без нее доступен только формат JSON Lines
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Добавляем путь к модулю device
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from device.device_client import (
-    DeviceClient, DeviceConfig, InterfaceType, 
+    DeviceClient, DeviceConfig, InterfaceType,
     create_device_client, ConnectionError
 )
+from device.async_udp_driver import AsyncUDPDriver
 
 class DeviceMonitor:
     """
@@ -47,6 +65,27 @@ class DeviceMonitor:
         self.device = None
         self.is_running = False
         self.logger = self._setup_logging()
+
+        # Файл лога показаний держим открытым между записями
+        # (открывается лениво при первой записи); размер считаем
+        # в процессе, чтобы не делать stat на каждый цикл.
+        # Путь и параметры ротации не меняются за время жизни процесса —
+        # вычисляем один раз здесь, а не на каждую запись
+        self._log_fd = None
+        self._log_bytes = 0
+
+        monitoring = self.config.get('monitoring', {})
+        self._log_file = monitoring.get('log_file', 'device_readings.log')
+        self._log_max_bytes = monitoring.get('max_log_size_mb', 10) * 1024 * 1024
+        self._log_max_files = monitoring.get('max_log_files', 5)
+        self._log_msgpack = monitoring.get('log_format', 'jsonl') == 'msgpack' and msgpack is not None
+
+        log_dir = os.path.dirname(self._log_file)
+        if log_dir:
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+            except OSError as e:
+                print(f"Не удалось создать директорию лога {log_dir}: {e}")
         
         # Обработчики сигналов для graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -75,8 +114,7 @@ class DeviceMonitor:
         for path in default_paths:
             if path and os.path.exists(path):
                 try:
-                    with open(path, 'r') as f:
-                        config = yaml.safe_load(f)
+                    config = self._load_yaml_cached(path)
                     self.logger = logging.getLogger(__name__)
                     self.logger.info(f"Загружена конфигурация из {path}")
                     return config
@@ -108,7 +146,44 @@ class DeviceMonitor:
         
         print("Используется конфигурация по умолчанию")
         return default_config
-    
+
+    @staticmethod
+    def _load_yaml_cached(path: str) -> Dict[str, Any]:
+        """
+        Загрузка YAML с pickle-кэшем разобранного результата
+
+        Рядом с yaml-файлом держится path.pkl с уже разобранной
+        конфигурацией: если кэш не старше yaml, читаем его (pickle.load
+        на порядки быстрее парсинга YAML). Иначе парсим YAML C-загрузчиком
+        и обновляем кэш; недоступность кэша на запись (например, /etc
+        без прав) — не ошибка.
+
+        Args:
+            path: Путь к yaml-файлу
+
+        Returns:
+            Dict: Конфигурация
+        """
+        cache_path = path + '.pkl'
+
+        try:
+            if os.stat(cache_path).st_mtime >= os.stat(path).st_mtime:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+        return config
+
     def _setup_logging(self) -> logging.Logger:
         """
         Настройка логирования
@@ -170,49 +245,52 @@ class DeviceMonitor:
     def _log_reading(self, reading: Dict[str, Any]) -> None:
         """
         Запись показаний в лог файл
-        
+
+        Каждая запись дописывается в конец файла: стоимость записи O(1)
+        вместо чтения и перезаписи всей истории, а обрыв процесса посреди
+        записи не ломает предыдущие записи.
+
+        Формат задается опцией monitoring.log_format:
+          - 'jsonl' (по умолчанию) — одна JSON-строка на запись;
+          - 'msgpack' — бинарная запись msgpack с 4-байтным префиксом
+            длины (little-endian): компактнее и быстрее при разборе,
+            требует установленный пакет msgpack.
+
         Args:
             reading: Показания устройства
         """
-        log_config = self.config['monitoring']
-        log_file = log_config.get('log_file', 'device_readings.log')
-        
         try:
-            # Создаем директорию если нужно
-            log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir, exist_ok=True)
-            
-            # Проверяем размер файла (ротация)
-            if os.path.exists(log_file):
-                file_size_mb = os.path.getsize(log_file) / (1024 * 1024)
-                if file_size_mb > log_config.get('max_log_size_mb', 10):
-                    self._rotate_log_file(log_file, log_config.get('max_log_files', 5))
-            
-            # Читаем существующие данные
-            data = []
-            if os.path.exists(log_file):
-                try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        if content:
-                            data = json.loads(content)
-                            if not isinstance(data, list):
-                                # Если файл не список, создаём новый
-                                data = [data] if content else []
-                except json.JSONDecodeError:
-                    # Если JSON сломан, начинаем заново
-                    data = []
-            
-            # Добавляем новую запись
-            data.append(reading)
-            
-            # Записываем ВЕСЬ список обратно
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            self.logger.debug(f"Записаны показания в {log_file}, всего записей: {len(data)}")
-            
+            # Ленивое открытие: один os.open на весь процесс. Сырой fd
+            # без буферизации Python — O_APPEND гарантирует атомарный
+            # append на уровне ядра, O_CLOEXEC не отдает дескриптор
+            # дочерним процессам при демонизации
+            if self._log_fd is None:
+                self._log_fd = os.open(
+                    self._log_file,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC,
+                    0o644,
+                )
+                # Стартовый размер берем один раз при открытии
+                self._log_bytes = os.fstat(self._log_fd).st_size
+
+            if self._log_msgpack:
+                buf = msgpack.packb(reading, use_bin_type=True)
+                record = struct.pack('<I', len(buf)) + buf
+            else:
+                record = json.dumps(reading, ensure_ascii=False).encode('utf-8') + b'\n'
+            os.write(self._log_fd, record)
+            self._log_bytes += len(record)
+
+            # Ротация по внутрипроцессному счетчику — ни одного stat
+            # на горячем пути записи
+            if self._log_bytes > self._log_max_bytes:
+                os.close(self._log_fd)
+                self._log_fd = None
+                self._log_bytes = 0
+                self._rotate_log_file(self._log_file, self._log_max_files)
+
+            self.logger.debug("Записаны показания в %s", self._log_file)
+
         except Exception as e:
             self.logger.error(f"Ошибка записи в лог: {e}")
     
@@ -225,19 +303,21 @@ class DeviceMonitor:
             max_files: Максимальное количество файлов
         """
         try:
-            # Удаляем самый старый файл если превышен лимит
+            # Сдвигаем файлы одним os.replace на слот: атомарный rename
+            # без предварительного stat, несуществующие слоты просто
+            # пропускаются по FileNotFoundError. Самый старый файл
+            # перезаписывается этим же rename — отдельный remove не нужен
             for i in range(max_files - 1, 0, -1):
-                old_file = f"{log_file}.{i}"
-                if os.path.exists(old_file):
-                    if i == max_files - 1:
-                        os.remove(old_file)  # Удаляем самый старый
-                    else:
-                        os.rename(old_file, f"{log_file}.{i+1}")
-            
-            # Переименовываем текущий файл
-            if os.path.exists(log_file):
-                os.rename(log_file, f"{log_file}.1")
-                
+                try:
+                    os.replace(f"{log_file}.{i}", f"{log_file}.{i+1}")
+                except FileNotFoundError:
+                    pass
+
+            try:
+                os.replace(log_file, f"{log_file}.1")
+            except FileNotFoundError:
+                pass
+
         except Exception as e:
             self.logger.error(f"Ошибка ротации лог файла: {e}")
     
@@ -251,64 +331,157 @@ class DeviceMonitor:
     def run(self) -> None:
         """
         Основной цикл мониторинга
+
+        При monitoring.async: true и UDP-интерфейсе цикл работает на
+        asyncio (AsyncUDPDriver): один event loop перекрывает сетевые
+        задержки вместо блокирующих recv, что готовит почву для опроса
+        нескольких устройств одним потоком.
         """
+        if (self.config['monitoring'].get('async')
+                and self.config['device'].get('interface', 'udp') == 'udp'):
+            asyncio.run(self._run_async())
+            return
+
         if not self._setup_device():
             self.logger.error("Не удалось подключиться к устройству. Выход.")
             return
         
         self.is_running = True
         period = self.config['monitoring'].get('period', 2.0)
-        
+
         self.logger.info(f"Запуск мониторинга с периодом {period} секунд")
-        
+
+        # Горячий цикл: все атрибутные цепочки выносим в локальные
+        # переменные один раз — LOAD_FAST вместо LOAD_ATTR/LOAD_METHOD
+        # на каждой итерации
+        get_reading = self.device.get_reading
+        log_reading = self._log_reading
+        log_info = self.logger.info
+        log_warn = self.logger.warning
+        log_err = self.logger.error
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
+
+        # Планирование по абсолютным дедлайнам монотонных часов: период
+        # не дрейфует от длительности циклов и не зависит от скачков
+        # системного времени (NTP)
+        period_ns = int(period * 1e9)
+        next_tick = monotonic_ns() + period_ns
+
         try:
             while self.is_running:
-                cycle_start = time.time()
-                
                 try:
                     # Получаем показания
-                    reading = self.device.get_reading()
-                    
-                    # Конвертируем в словарь для JSON
-                    reading_dict = reading.to_dict()
-                    
+                    reading = get_reading()
+
                     # Записываем в лог
-                    self._log_reading(reading_dict)
-                    
+                    log_reading(reading.to_dict())
+
                     # Логируем в консоль (только если не ERROR)
                     if reading.status == "OK":
-                        self.logger.info(
-                            f"Показания: {reading.voltage}, {reading.current}, "
-                            f"SN: {reading.serial}"
+                        log_info(
+                            "Показания: %s, %s, SN: %s",
+                            reading.voltage, reading.current, reading.serial
                         )
                     else:
-                        self.logger.warning(
-                            f"Ошибка: {reading.error} | "
-                            f"Показания: {reading.voltage}, {reading.current}"
+                        log_warn(
+                            "Ошибка: %s | Показания: %s, %s",
+                            reading.error, reading.voltage, reading.current
                         )
-                        
+
+                except ConnectionError as e:
+                    log_err(f"КРИТИЧЕСКАЯ ОШИБКА: Потеряно соединение с устройством: {e}")
+                    log_err("Завершение работы согласно требованиям спецификации")
+                    break  # Выходим из цикла while (немедленное завершение)
+
+                except Exception as e:
+                    log_err(f"Ошибка в цикле мониторинга: {e}")
+
+                # Спим до следующего дедлайна; при сильном перерасходе
+                # цикла привязываем дедлайн заново, чтобы не устроить
+                # серию догоняющих циклов без пауз
+                now = monotonic_ns()
+                delay = next_tick - now
+                if delay > 0:
+                    sleep(delay / 1e9)
+                    next_tick += period_ns
+                else:
+                    next_tick = now + period_ns
+
+        finally:
+            self._cleanup()
+
+    async def _run_async(self) -> None:
+        """
+        Асинхронный цикл мониторинга (UDP)
+
+        Показания запрашиваются параллельным get_triplet асинхронного
+        драйвера; пауза между циклами — await asyncio.sleep, не
+        блокирующая event loop.
+        """
+        device_config = self.config['device']
+        period = self.config['monitoring'].get('period', 2.0)
+
+        driver = AsyncUDPDriver(
+            host=device_config.get('host', '127.0.0.1'),
+            port=device_config.get('port', 10000),
+            timeout=device_config.get('timeout', 5.0),
+        )
+
+        try:
+            await driver.connect()
+        except ConnectionError as e:
+            self.logger.error(f"Ошибка подключения: {e}")
+            self.logger.error("Не удалось подключиться к устройству. Выход.")
+            return
+
+        self.is_running = True
+        self.logger.info(f"Запуск асинхронного мониторинга с периодом {period} секунд")
+
+        try:
+            while self.is_running:
+                cycle_start = time.monotonic()
+
+                try:
+                    voltage, current, serial_num = await driver.get_triplet()
+                    self._log_reading({
+                        'timestamp': datetime.now().isoformat(),
+                        'voltage': voltage,
+                        'current': current,
+                        'serial': serial_num,
+                        'status': 'OK',
+                        'error': None,
+                    })
+                    self.logger.info("Показания: %s, %s, SN: %s",
+                                     voltage, current, serial_num)
+
                 except ConnectionError as e:
                     self.logger.error(f"КРИТИЧЕСКАЯ ОШИБКА: Потеряно соединение с устройством: {e}")
                     self.logger.error("Завершение работы согласно требованиям спецификации")
-                    break  # Выходим из цикла while (немедленное завершение)
-                        
+                    break
+
                 except Exception as e:
                     self.logger.error(f"Ошибка в цикле мониторинга: {e}")
-                
-                # Вычисляем время до следующего цикла
-                cycle_time = time.time() - cycle_start
+
+                cycle_time = time.monotonic() - cycle_start
                 sleep_time = max(0.1, period - cycle_time)
-                
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                    
+                await asyncio.sleep(sleep_time)
+
         finally:
+            driver.disconnect()
             self._cleanup()
-    
+
     def _cleanup(self):
         """Очистка ресурсов"""
         self.logger.info("Очистка ресурсов...")
-        
+
+        if self._log_fd is not None:
+            try:
+                os.close(self._log_fd)
+            except OSError:
+                pass
+            self._log_fd = None
+
         if self.device:
             try:
                 self.device.disconnect()
@@ -6,34 +6,142 @@ log_grep.py - Ищет слово в логах LNS проекта
 Пример: python log_grep.py V_12V
 """
 
+import io
+import re
 import sys
 import json
+import mmap
+import struct
+from bisect import bisect_right
+
+# msgpack — опциональная зависимость, нужна только для чтения
+# бинарного формата лога (monitoring.log_format: msgpack)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# ijson — опциональный потоковый (SAX) парсер для старого формата
+# «весь файл — JSON-массив»: память остается постоянной на любом
+# размере лога; без него массив загружается целиком
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Задаем конкретные пути
 TEXT_LOG = "/var/log/lns_project/device_monitor.log"
 JSON_LOG = "/var/log/lns_project/device_data.json"
 
+def iter_json_entries(f):
+    """
+    Итерация по записям лога показаний
+
+    Основной формат — JSON Lines (одна запись на строку), читается
+    потоково без загрузки файла в память. Старый формат (весь файл —
+    JSON-массив) распознается по первому байту '['. Бинарный формат
+    msgpack (записи с 4-байтным префиксом длины) — по любому другому
+    первому байту.
+    """
+    first = f.read(1)
+    f.seek(0)
+
+    if first == b'[':
+        # Старый формат: JSON-массив. С ijson читается потоково
+        # (постоянная память и возможность оборвать поиск на первом
+        # совпадении), без него — загружается целиком
+        if ijson is not None:
+            yield from ijson.items(f, 'item')
+        else:
+            yield from json.load(io.TextIOWrapper(f, encoding='utf-8'))
+    elif first == b'{':
+        # JSON Lines: по строке за раз, постоянная память
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+    elif first:
+        # msgpack: [4 байта длины LE][запись]...
+        if msgpack is None:
+            print("Лог в формате msgpack, но пакет msgpack не установлен")
+            return
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                break
+            (length,) = struct.unpack('<I', header)
+            buf = f.read(length)
+            if len(buf) < length:
+                break
+            yield msgpack.unpackb(buf, raw=False)
+
+def search_in_text(word):
+    """
+    Поиск в текстовом логе через mmap
+
+    Файл отображается в память и сканируется одним проходом
+    регулярного выражения на уровне C — без построчного чтения
+    и line.lower() в интерпретаторе на каждую строку. Номера строк
+    восстанавливаются бинарным поиском по заранее собранным
+    смещениям переводов строки.
+
+    Returns:
+        bool: True если найдено хотя бы одно совпадение
+    """
+    found = False
+    try:
+        with open(TEXT_LOG, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Пустой файл нельзя отобразить
+                return False
+
+            with mm:
+                pattern = re.compile(re.escape(word.encode('utf-8')), re.IGNORECASE)
+
+                # Смещения '\n' собираем один раз: mm.find работает в C
+                newlines = []
+                pos = mm.find(b'\n')
+                while pos != -1:
+                    newlines.append(pos)
+                    pos = mm.find(b'\n', pos + 1)
+
+                last_line = -1
+                for match in pattern.finditer(mm):
+                    line_no = bisect_right(newlines, match.start())
+                    if line_no == last_line:
+                        continue  # Несколько совпадений в одной строке
+                    last_line = line_no
+
+                    start = newlines[line_no - 1] + 1 if line_no > 0 else 0
+                    end = newlines[line_no] if line_no < len(newlines) else len(mm)
+                    line = mm[start:end].decode('utf-8', errors='ignore').strip()
+                    print(f"device_monitor.log:{line_no + 1}: {line}")
+                    found = True
+    except FileNotFoundError:
+        print(f"Файл {TEXT_LOG} не найден")
+
+    return found
+
 def search_in_json(word):
     """Умный поиск в JSON файле"""
     try:
-        with open(JSON_LOG, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        if isinstance(data, list):
-            for idx, entry in enumerate(data, 1):
+        with open(JSON_LOG, 'rb') as f:
+            for idx, entry in enumerate(iter_json_entries(f), 1):
                 # Для слова ERROR: ищем только реальные ошибки (не null)
                 if word == "error":
                     error_value = entry.get("error")
                     if error_value and error_value != "null" and str(error_value).lower() != "none":
                         print(f"device_data.json: запись #{idx}: ОШИБКА: {error_value}")
                         print(f"    Полная запись: {json.dumps(entry, ensure_ascii=False)}")
-                
+
                 # Для других слов: ищем в любом поле
                 else:
                     for key, value in entry.items():
                         if value and word in str(value).lower():
                             print(f"device_data.json: запись #{idx}, поле '{key}': {value}")
-                    
+
     except (FileNotFoundError, json.JSONDecodeError):
         # Файл не найден или не JSON
         pass
@@ -56,18 +164,9 @@ def main():
     print(f"Поиск '{word}' в логах...")
     print("-" * 60)
     
-    found_anything = False
-    
-    # 1. Ищем в текстовом логе
-    try:
-        with open(TEXT_LOG, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f, 1):
-                if word in line.lower():
-                    print(f"device_monitor.log:{i}: {line.strip()}")
-                    found_anything = True
-    except FileNotFoundError:
-        print(f"Файл {TEXT_LOG} не найден")
-    
+    # 1. Ищем в текстовом логе (один проход по mmap)
+    found_anything = search_in_text(word)
+
     # 2. Ищем в JSON логе
     search_in_json(word)
     
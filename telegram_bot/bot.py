@@ -1,20 +1,47 @@
 #!/usr/bin/env python3
 """
 lns_project_bot - Простой бот для проверки устройства LNS_Project
-Только 2 команды:
+Команды:
 /start - приветствие
 /status - проверить устройство
+/logs - последние записи лога показаний
 """
 
+import asyncio
+import json
+import os
+import re
 import socket
 import time
 import logging
+from collections import deque
 from datetime import datetime
 
+# ijson — опциональный потоковый парсер для старого формата лога
+# (весь файл — JSON-массив); без него массив загружается целиком
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from telegram import Update
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
+
+# Работает и как модуль пакета (from telegram_bot.bot import ...),
+# и как самостоятельный скрипт (python bot.py)
+try:
+    from .config import BOT_TOKEN, ADMIN_ID, DEVICE_HOST, DEVICE_PORT, TIMEOUT
+except ImportError:
+    from config import BOT_TOKEN, ADMIN_ID, DEVICE_HOST, DEVICE_PORT, TIMEOUT
+
+# Пользователи, которым разрешены административные команды (/restart).
+# frozenset: проверка членства за O(1) вместо сканирования списка
+ADMIN_IDS = frozenset((ADMIN_ID,))
+
 
-from config import BOT_TOKEN, DEVICE_HOST, DEVICE_PORT, TIMEOUT
+def is_admin(user_id: int) -> bool:
+    """Является ли пользователь администратором бота"""
+    return user_id in ADMIN_IDS
 
 # Настройка логирования
 logging.basicConfig(
@@ -23,32 +50,228 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def check_device_simple():
+class _DeviceProtocol(asyncio.DatagramProtocol):
+    """
+    Протокол asyncio для обмена с устройством
+
+    Ответы сопоставляются с запросами по префиксу (V_/A_/S_) через
+    futures — датаграммы могут приходить в любом порядке.
+    """
+
+    def __init__(self):
+        self.transport = None
+        self.pending = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        response = data.decode('utf-8', errors='ignore').strip()
+        future = self.pending.pop(response[:2], None)
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def error_received(self, exc):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self.pending.clear()
+
+    def connection_lost(self, exc):
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Соединение закрыто"))
+        self.pending.clear()
+
+
+# Лог показаний монитора (формат JSON Lines: одна запись на строку)
+LOG_FILE = "/var/log/lns_project/device_data.json"
+
+# Команды устройства, закодированные один раз при импорте: горячий путь
+# отправки — чистый sendto(bytes) без encode на каждый запрос
+_CMD_V = b"GET_V"
+_CMD_A = b"GET_A"
+_CMD_S = b"GET_S"
+_COMMANDS = ((_CMD_V, "V_"), (_CMD_A, "A_"), (_CMD_S, "S_"))
+
+# Пакетная команда: одна датаграмма вместо трёх, ответ "V_...;A_...;S_..."
+_CMD_VAS = b"GET_VAS"
+
+# Лимит Telegram на сообщение — 4096 символов; оставляем небольшой запас
+_TG_MESSAGE_LIMIT = 4000
+
+# Ключевые слова свободных сообщений компилируются один раз: поиск
+# идет одним C-проходом re вместо цепочки `word in text` на сообщение
+_HELLO_RE = re.compile(r'(привет|hello|hi)', re.IGNORECASE)
+_STATUS_RE = re.compile(r'(статус|status|как дела)', re.IGNORECASE)
+
+# Адрес устройства резолвим один раз при импорте: если DEVICE_HOST —
+# имя, getaddrinfo при каждом создании канала ходил бы в блокирующий
+# DNS-резолвер. При недоступности DNS на старте оставляем имя как есть —
+# резолв произойдет при первом подключении
+try:
+    _DEVICE_ADDR = (socket.gethostbyname(DEVICE_HOST), DEVICE_PORT)
+except socket.gaierror:
+    _DEVICE_ADDR = (DEVICE_HOST, DEVICE_PORT)
+
+# Долгоживущий UDP-канал к устройству: (transport, protocol).
+# Создается при первом /status и переиспользуется всеми последующими —
+# без создания сокета и datagram endpoint на каждый запрос
+_device_conn = None
+
+
+async def _get_device_connection():
+    """Возвращает живой канал к устройству, создавая его при необходимости"""
+    global _device_conn
+
+    if _device_conn is not None and not _device_conn[0].is_closing():
+        return _device_conn
+
+    # Сокет создаем сами ради явных буферов: всплеск параллельных
+    # /status не переполняет приемную очередь, маленькие датаграммы
+    # не нуждаются в path-MTU discovery
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    for opt, value in ((socket.SO_RCVBUF, 262144), (socket.SO_SNDBUF, 65536)):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, opt, value)
+        except OSError:
+            pass
+    if hasattr(socket, 'IP_MTU_DISCOVER'):
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MTU_DISCOVER,
+                            socket.IP_PMTUDISC_DONT)
+        except OSError:
+            pass
+    sock.setblocking(False)
+    sock.connect(_DEVICE_ADDR)
+
+    loop = asyncio.get_running_loop()
+    _device_conn = await loop.create_datagram_endpoint(
+        _DeviceProtocol,
+        sock=sock
+    )
+    return _device_conn
+
+
+def _drop_device_connection():
+    """Закрытие канала после ошибки — следующий запрос создаст новый"""
+    global _device_conn
+
+    if _device_conn is not None:
+        _device_conn[0].close()
+        _device_conn = None
+
+
+# Маркер «устройство не поддерживает пакетную команду — опросить веером»
+_FALLBACK = object()
+
+
+async def _query_batch(loop, transport, protocol):
     """
-    Простейшая проверка устройства через UDP
+    Опрос одной пакетной датаграммой GET_VAS
+
+    Returns:
+        tuple: (напряжение, ток, серийный номер) при успехе;
+        _FALLBACK, если устройство команду не поддерживает;
+        None при таймауте (устройство молчит)
+    """
+    future = loop.create_future()
+    error_future = loop.create_future()
+    protocol.pending["V_"] = future       # пакетный ответ начинается с V_
+    protocol.pending["ER"] = error_future  # старая прошивка ответит ERROR
+    transport.sendto(_CMD_VAS)
+
+    try:
+        done, _ = await asyncio.wait(
+            (future, error_future),
+            timeout=TIMEOUT,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        protocol.pending.pop("V_", None)
+        protocol.pending.pop("ER", None)
+
+    # Ошибка канала роняет оба future — забираем исключение из каждого,
+    # чтобы не оставить «exception was never retrieved», и пробрасываем
+    exc = None
+    for f in (future, error_future):
+        if f.done() and f.exception() is not None:
+            exc = exc or f.exception()
+    if exc is not None:
+        raise exc
+
+    if future in done:
+        parts = future.result().split(';')
+        if len(parts) == 3:
+            return tuple(parts)
+        return _FALLBACK
+    if error_future in done:
+        return _FALLBACK
+    return None
+
+
+async def _query_fanout(loop, transport, protocol):
+    """
+    Веерный опрос тремя отдельными командами (совместимый путь)
+
+    Returns:
+        tuple: (напряжение, ток, серийный номер) или None при таймауте
+    """
+    futures = {}
+    for command, prefix in _COMMANDS:
+        futures[prefix] = loop.create_future()
+        protocol.pending[prefix] = futures[prefix]
+        transport.sendto(command)
+
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(futures["V_"], futures["A_"], futures["S_"],
+                           return_exceptions=True),
+            TIMEOUT
+        )
+        # Ошибка канала роняет все future — пробрасываем первую,
+        # забрав остальные, чтобы не засорять лог предупреждениями
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return tuple(results)
+    except asyncio.TimeoutError:
+        # Канал жив, просто нет ответа: снимаем ожидания и
+        # оставляем сокет следующему запросу
+        for prefix in futures:
+            protocol.pending.pop(prefix, None)
+        return None
+
+
+async def check_device():
+    """
+    Проверка устройства через UDP
     Устройство должно отвечать на команды:
     - "GET_V" -> "V_12V" (напряжение)
     - "GET_A" -> "A_1A"  (ток)
     - "GET_S" -> "S_DSA123" (серийный номер)
+
+    Все три команды отправляются сразу, ответы ждутся параллельно через
+    gather — итоговая задержка ~1 RTT вместо трёх, и event loop бота
+    не блокируется на время опроса. Сокет переиспользуется между
+    запросами и пересоздается только после ошибки канала.
     """
     try:
-        # Создаем UDP сокет
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(TIMEOUT)
-        
-        # Функция для отправки команды и получения ответа
-        def send_command(command):
-            sock.sendto(command.encode('utf-8'), (DEVICE_HOST, DEVICE_PORT))
-            data, _ = sock.recvfrom(1024)
-            return data.decode('utf-8', errors='ignore').strip()
-        
-        # Получаем все показания
-        voltage = send_command("GET_V")
-        current = send_command("GET_A")
-        serial = send_command("GET_S")
-        
-        sock.close()
-        
+        loop = asyncio.get_running_loop()
+        transport, protocol = await _get_device_connection()
+
+        # Сначала пакетный запрос: одна датаграмма и один ответ вместо
+        # трёх. Если устройство команду не знает (ответило ERROR) —
+        # откатываемся на веерный опрос тремя командами
+        readings = await _query_batch(loop, transport, protocol)
+        if readings is _FALLBACK:
+            readings = await _query_fanout(loop, transport, protocol)
+
+        if readings is None or readings is _FALLBACK:
+            return False, f"❌ Устройство не отвечает (таймаут {TIMEOUT} сек)"
+
+        voltage, current, serial = readings
+
         # Формируем сообщение
         message = (
             f"✅ Устройство доступно\n\n"
@@ -58,18 +281,119 @@ def check_device_simple():
             f"Серийный номер: {serial}\n\n"
             f"🕐 {datetime.now().strftime('%H:%M:%S')}"
         )
-        
+
         return True, message
-        
-    except socket.timeout:
-        return False, f"❌ Устройство не отвечает (таймаут {TIMEOUT} сек)"
+
     except ConnectionRefusedError:
+        _drop_device_connection()
         return False, "❌ Соединение отклонено устройством"
     except socket.gaierror:
+        _drop_device_connection()
         return False, f"❌ Не удается найти устройство {DEVICE_HOST}:{DEVICE_PORT}"
     except Exception as e:
+        _drop_device_connection()
         return False, f"❌ Ошибка подключения: {str(e)}"
 
+def _tail_log_entries(path: str, count: int = 5):
+    """
+    Последние count записей JSONL-лога без чтения всего файла
+
+    Файл читается с конца блоками по 8 КБ, пока не наберется нужное
+    число строк — стоимость O(count) записей вместо разбора всей
+    истории. Битые строки (например, оборванная запись) пропускаются.
+    Старый формат (весь файл — JSON-массив) распознается по первому
+    байту '[' и читается потоково через ijson, если тот установлен.
+
+    Returns:
+        list: Записи показаний (словари), от старых к новым
+    """
+    block = 8192
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as f:
+        if f.read(1) == b'[':
+            f.seek(0)
+            if ijson is not None:
+                # Потоковый разбор: в памяти только последние count записей
+                recent = deque(
+                    (
+                        {k: item.get(k) for k in ('timestamp', 'voltage', 'current', 'status')}
+                        for item in ijson.items(f, 'item')
+                    ),
+                    maxlen=count,
+                )
+                return list(recent)
+            return json.load(f)[-count:]
+
+        f.seek(0)
+        buf = b''
+        pos = size
+        # Набираем блоки с конца, пока не соберем count полных строк
+        while pos > 0 and buf.count(b'\n') <= count:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+
+    entries = []
+    for line in buf.splitlines()[-count:]:
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
+
+
+async def logs_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Обработчик команды /logs — последние записи показаний
+
+    /logs [N] показывает N последних записей (по умолчанию 5, не более
+    100). Длинный вывод уходит несколькими сообщениями: строки
+    накапливаются до лимита Telegram и сбрасываются по мере заполнения,
+    полная склейка всего ответа в одну строку не материализуется.
+    """
+    count = 5
+    if context.args:
+        try:
+            count = min(max(int(context.args[0]), 1), 100)
+        except ValueError:
+            pass
+
+    try:
+        # Файловый ввод-вывод — блокирующий: уводим его в поток, чтобы
+        # /logs на медленном диске не останавливал обработку апдейтов
+        entries = await asyncio.to_thread(_tail_log_entries, LOG_FILE, count)
+    except FileNotFoundError:
+        await update.message.reply_text(f"📜 Лог {LOG_FILE} не найден")
+        return
+    except Exception as e:
+        await update.message.reply_text(f"❌ Ошибка чтения лога: {e}")
+        return
+
+    if not entries:
+        await update.message.reply_text("📜 Лог пуст")
+        return
+
+    buf = ["📜 Последние записи:"]
+    buf_len = len(buf[0])
+    for entry in entries:
+        line = (
+            f"• {entry.get('timestamp', '?')}: "
+            f"{entry.get('voltage', '?')}, {entry.get('current', '?')}, "
+            f"статус {entry.get('status', '?')}"
+        )
+        if buf and buf_len + len(line) + 1 > _TG_MESSAGE_LIMIT:
+            await update.message.reply_text("\n".join(buf))
+            buf = []
+            buf_len = 0
+        buf.append(line)
+        buf_len += len(line) + 1
+
+    if buf:
+        await update.message.reply_text("\n".join(buf))
+
+
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обработчик команды /start"""
     user = update.effective_user
@@ -85,7 +409,7 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text("🔍 Проверяю устройство...")
     
     # Выполняем проверку
-    success, message = check_device_simple()
+    success, message = await check_device()
     
     # Отправляем результат
     await update.message.reply_text(message)
@@ -94,26 +418,124 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     logger.info(f"Проверка от {user.username} ({user.id}): {success}")
 
+async def restart_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Обработчик команды /restart — перезапуск сервиса мониторинга
+
+    Только для администраторов. systemctl запускается через
+    create_subprocess_exec: event loop продолжает обрабатывать другие
+    апдейты на время перезапуска, а сама команда ограничена 30 секундами.
+    """
+    user = update.effective_user
+    if not is_admin(user.id):
+        await update.message.reply_text("⛔ Команда доступна только администратору")
+        logger.warning(f"Отказ в /restart для {user.username} ({user.id})")
+        return
+
+    await update.message.reply_text("🔄 Перезапускаю сервис lns_project...")
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'sudo', 'systemctl', 'restart', 'lns_project',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await update.message.reply_text("⏱️ systemctl не ответил за 30 секунд")
+        return
+    except Exception as e:
+        await update.message.reply_text(f"❌ Ошибка перезапуска: {e}")
+        return
+
+    if proc.returncode == 0:
+        await update.message.reply_text("✅ Сервис перезапущен")
+    else:
+        error = stderr.decode('utf-8', errors='ignore').strip()
+        await update.message.reply_text(f"❌ systemctl завершился с ошибкой: {error}")
+
+    logger.info(f"Перезапуск сервиса от {user.username} ({user.id}): код {proc.returncode}")
+
+
+async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Обработчик свободных текстовых сообщений
+
+    «Привет»-подобные сообщения получают подсказку, вопросы о статусе
+    запускают ту же проверку, что и /status. Остальное игнорируется.
+    """
+    text = update.message.text or ""
+
+    if _STATUS_RE.search(text):
+        await status_command(update, context)
+    elif _HELLO_RE.search(text):
+        user = update.effective_user
+        await update.message.reply_text(
+            f"👋 Привет, {user.first_name}!\n"
+            f"Отправь /status чтобы проверить устройство."
+        )
+
+
+class LNSBot:
+    """
+    Бот проверки устройства LNS
+
+    Единственная точка сборки Application: все обработчики
+    регистрируются один раз, один HTTPX-пул и один long-poll
+    к api.telegram.org на процесс.
+    """
+
+    def __init__(self, token: str = BOT_TOKEN):
+        # Таймауты HTTPX подобраны под long-poll в 25 секунд:
+        # read_timeout заведомо больше длины поллинга, чтобы штатное
+        # ожидание getUpdates не рубилось как сетевой таймаут
+        self.application = (
+            Application.builder()
+            .token(token)
+            .connect_timeout(10)
+            .read_timeout(35)
+            .write_timeout(10)
+            .pool_timeout(5)
+            .build()
+        )
+        self._register_handlers()
+
+    def _register_handlers(self):
+        """Регистрация команд бота"""
+        self.application.add_handler(CommandHandler("start", start_command))
+        self.application.add_handler(CommandHandler("status", status_command))
+        self.application.add_handler(CommandHandler("logs", logs_command))
+        self.application.add_handler(CommandHandler("restart", restart_command))
+        self.application.add_handler(CommandHandler("help", start_command))  # help = start
+        self.application.add_handler(
+            MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message)
+        )
+
+    def run(self):
+        """Запуск бота (блокирует до Ctrl+C)"""
+        print("=" * 50)
+        print("🚀 Запуск lns_project_bot")
+        print(f"📡 Устройство: {DEVICE_HOST}:{DEVICE_PORT}")
+        print(f"⏱ Таймаут: {TIMEOUT} сек")
+        print("=" * 50)
+        print("🤖 Бот запущен. Нажмите Ctrl+C для остановки.")
+
+        # Длинный poll 25 с (под 30-секундный лимит прокси) и нулевая
+        # пауза между опросами: новый запрос уходит сразу после ответа,
+        # без холостого ожидания и без шторма коротких запросов
+        self.application.run_polling(
+            poll_interval=0.0,
+            timeout=25,
+            bootstrap_retries=-1,
+            drop_pending_updates=True,
+            allowed_updates=Update.ALL_TYPES,
+        )
+
+
 def main():
     """Главная функция запуска бота"""
-    print("=" * 50)
-    print("🚀 Запуск lns_project_bot")
-    print(f"📡 Устройство: {DEVICE_HOST}:{DEVICE_PORT}")
-    print(f"⏱ Таймаут: {TIMEOUT} сек")
-    print("=" * 50)
-    
-    # Создаем приложение
-    application = Application.builder().token(BOT_TOKEN).build()
-    
-    # Регистрируем команды
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("status", status_command))
-    application.add_handler(CommandHandler("help", start_command))  # help = start
-    
-    print("🤖 Бот запущен. Нажмите Ctrl+C для остановки.")
-    
-    # Запускаем бота
-    application.run_polling(drop_pending_updates=True)
+    LNSBot().run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
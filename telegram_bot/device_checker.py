@@ -5,10 +5,20 @@
 
 import sys
 import os
+import time
+import threading
 import yaml
+from functools import lru_cache
 from typing import Dict, Any, Tuple
 import logging
 
+# C-загрузчик YAML (libyaml) в разы быстрее чистопитоновского;
+# при сборке PyYAML без libyaml откатываемся на SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Добавляем путь к модулю device
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
@@ -17,6 +27,26 @@ from device.device_client import create_device_client
 
 logger = logging.getLogger(__name__)
 
+# Статические фрагменты удачного /status-сообщения: собраны заранее,
+# на каждый вызов остается один "".join с подстановкой показаний
+_MSG_OK_PREFIX = "✅ Устройство доступно\n📊 Показания:\n• Напряжение: "
+_MSG_OK_SEP_A = "\n• Ток: "
+_MSG_OK_SEP_S = "\n• Серийный номер: "
+_MSG_OK_SEP_T = "\n• Время: "
+
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Разбор YAML с мемоизацией по (путь, mtime)
+
+    Повторные создания DeviceChecker с тем же файлом не парсят YAML
+    заново; правка файла меняет mtime и автоматически инвалидирует кэш.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 class DeviceChecker:
     """Класс для проверки доступности устройства"""
     
@@ -29,13 +59,24 @@ class DeviceChecker:
         """
         self.config_path = config_path or "/etc/lns_project/config.yaml"
         self.config = self._load_config()
+
+        # TTL-кэш последнего удачного ответа: несколько /status подряд
+        # от разных пользователей не гоняют устройство повторно.
+        # Кэш: (монотонная метка после опроса, (успешно, сообщение, данные))
+        self._cache = None
+        self._ttl = 2.0
+
+        # Долгоживущий клиент устройства: создается при первом опросе
+        # и переиспользуется, а не пересоздается на каждый /status.
+        # Блокировка сериализует параллельные проверки на одном канале
+        self._device = None
+        self._device_lock = threading.Lock()
     
     def _load_config(self) -> Dict[str, Any]:
         """Загрузка конфигурации устройства"""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    return yaml.safe_load(f)
+                return _load_yaml(self.config_path, os.path.getmtime(self.config_path))
             else:
                 logger.warning(f"Файл конфигурации не найден: {self.config_path}")
                 # Возвращаем конфиг по умолчанию
@@ -51,45 +92,66 @@ class DeviceChecker:
             logger.error(f"Ошибка загрузки конфигурации: {e}")
             return {}
     
-    def check_device_status(self) -> Tuple[bool, str, Dict[str, Any]]:
+    def check_device_status(self, ttl: float = None) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Проверка статуса устройства
-        
+
+        Удачный результат кэшируется на self._ttl секунд; повторные
+        вызовы внутри окна отдают кэш без обращения к устройству.
+
+        Args:
+            ttl: Время жизни кэша для этого вызова (секунды);
+                 0 — принудительно свежий опрос, None — self._ttl
+
         Returns:
             Tuple[bool, str, Dict]: (успешно, сообщение, данные)
         """
+        if ttl is None:
+            ttl = self._ttl
+        if self._cache is not None and time.monotonic() - self._cache[0] < ttl:
+            return self._cache[1]
+
         try:
             if not self.config or 'device' not in self.config:
+                self._cache = None
                 return False, "Ошибка конфигурации", {}
             
-            device_config = self.config['device']
-            
-            # Создаем клиент устройства
-            device = create_device_client(device_config)
-            
-            # Пробуем подключиться
-            if not device.connect():
-                return False, "❌ Не удалось подключиться к устройству", {}
-            
-            # Получаем показания
-            reading = device.get_reading()
-            device.disconnect()
-            
+            with self._device_lock:
+                # Клиент создается и подключается один раз; после
+                # ошибки канал сбрасывается и лениво пересоздается
+                device = self._device
+                if device is None:
+                    device = create_device_client(self.config['device'])
+                    if not device.connect():
+                        self._cache = None
+                        return False, "❌ Не удалось подключиться к устройству", {}
+                    self._device = device
+
+                # Получаем показания
+                try:
+                    reading = device.get_reading()
+                except Exception:
+                    self._drop_device()
+                    raise
+
             # Формируем сообщение
             if reading.status == "OK":
-                message = (
-                    f"✅ Устройство доступно\n"
-                    f"📊 Показания:\n"
-                    f"• Напряжение: {reading.voltage}\n"
-                    f"• Ток: {reading.current}\n"
-                    f"• Серийный номер: {reading.serial}\n"
-                    f"• Время: {reading.timestamp}"
-                )
-                return True, message, reading.to_dict()
+                message = "".join((
+                    _MSG_OK_PREFIX, reading.voltage,
+                    _MSG_OK_SEP_A, reading.current,
+                    _MSG_OK_SEP_S, reading.serial,
+                    _MSG_OK_SEP_T, reading.timestamp,
+                ))
+                result = (True, message, reading.to_dict())
             else:
                 message = f"⚠️ Устройство ответило с ошибкой: {reading.error}"
-                return True, message, reading.to_dict()
-                
+                result = (True, message, reading.to_dict())
+
+            # Метку времени кэша ставим после завершения опроса, чтобы
+            # TTL отсчитывался от актуальности данных, а не от старта
+            self._cache = (time.monotonic(), result)
+            return result
+
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Ошибка проверки устройства: {error_msg}")
@@ -103,9 +165,19 @@ class DeviceChecker:
                 message = "🔌 Устройство недоступно"
             else:
                 message = f"❌ Ошибка: {error_msg}"
-            
+
+            self._cache = None
             return False, message, {'error': error_msg}
     
+    def _drop_device(self) -> None:
+        """Закрытие мертвого канала — следующий вызов создаст новый"""
+        if self._device is not None:
+            try:
+                self._device.disconnect()
+            except Exception:
+                pass
+            self._device = None
+
     def get_device_info(self) -> str:
         """Получение информации о конфигурации устройства"""
         if not self.config or 'device' not in self.config:
@@ -4,40 +4,149 @@
 Отвечает на команды: GET_V, GET_A, GET_S
 """
 
+import asyncio
+import queue
 import socket
 import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import Tuple
 
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - [UDP Device] - %(levelname)s - %(message)s'
-)
+# Настройка логирования через очередь: горячий путь датаграммы лишь
+# кладет LogRecord в очередь, а форматирование и запись в stderr
+# выполняет фоновый поток QueueListener — ни одного write-syscall
+# на пакет в обработчике
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - [UDP Device] - %(levelname)s - %(message)s'
+))
+_queue_handler = QueueHandler(_log_queue)
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+# basicConfig навешивает на handler свой формат; в очереди запись должна
+# оставаться сырой — финальный формат применяет listener
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+
 logger = logging.getLogger('LNSDeviceEmulator')
 
+
+# Метка времени для консольного вывода: strftime зовется не чаще
+# одного раза в секунду, дальше отдается кэшированная строка
+_ts_cache = (0, '')
+
+
+def _timestamp() -> str:
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime('%H:%M:%S'))
+    return _ts_cache[1]
+
+class LNSProtocol(asyncio.DatagramProtocol):
+    """
+    Протокол asyncio эмулятора устройства
+
+    datagram_received вызывается настолько быстро, насколько epoll
+    отдает пакеты — параллельные клиенты не ждут друг друга в очереди
+    ядра, как при одном блокирующем recvfrom.
+    """
+
+    def __init__(self, server: 'LNSDeviceServer'):
+        self.server = server
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        server = self.server
+
+        # Горячий путь: сначала совпадение по сырым байтам (ноль
+        # аллокаций), затем по канонизированному виду — в обоих случаях
+        # ответ готовыми байтами без decode/encode
+        raw_response = (server._table.get(data)
+                        or server.responses_bytes.get(data.strip().upper()))
+        if raw_response is not None:
+            self.transport.sendto(raw_response, addr)
+            command = data.decode('utf-8', errors='ignore').strip()
+            response = raw_response.decode('utf-8')
+        else:
+            # Декодируем и обрабатываем команду
+            command = data.decode('utf-8', errors='ignore')
+            response = server.handle_command(command)
+            self.transport.sendto(response.encode('utf-8'), addr)
+
+        # Логируем входящий запрос и исходящий ответ
+        logger.info("Получено от %s:%s: %s", addr[0], addr[1], command)
+        logger.debug("Отправлено %s:%s: %s", addr[0], addr[1], response)
+
+        # Выводим в консоль для наглядности (только с --verbose)
+        if server.verbose:
+            print(f"[{_timestamp()}] {addr[0]}:{addr[1]} -> {command} -> {response}")
+
+
 class LNSDeviceServer:
     """UDP сервер, эмулирующий устройство LNS"""
-    
-    def __init__(self, host: str = '127.0.0.1', port: int = 10000):
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 10000, verbose: bool = False):
         self.host = host
         self.port = port
-        self.socket = None
+        self.verbose = verbose
         self.running = False
+
+        # Ссылки на event loop и событие остановки: stop() может
+        # вызываться из другого потока или обработчика сигнала
+        self._loop = None
+        self._stop_event = None
         
         # Статические ответы устройства 
         self.responses = {
             'GET_V': 'V_12V',
-            'GET_A': 'A_1A', 
+            'GET_A': 'A_1A',
             'GET_S': 'S_DSA123'
         }
+        # Пакетная команда: все показания одним ответом
+        self.responses['GET_ALL'] = ';'.join(
+            self.responses[cmd] for cmd in ('GET_V', 'GET_A', 'GET_S')
+        )
+        # Синоним пакетной команды, который использует telegram-бот
+        self.responses['GET_VAS'] = self.responses['GET_ALL']
+
+        # Байтовая таблица для горячего пути: команда в каноническом
+        # виде отвечается готовыми байтами без decode/encode на датаграмму
+        self.responses_bytes = {
+            cmd.encode('utf-8'): resp.encode('utf-8')
+            for cmd, resp in self.responses.items()
+        }
+
+        # Замороженная таблица точных полезных нагрузок: протокол
+        # фиксированный, поэтому частые варианты кадрирования (с \n
+        # и \r\n) прописаны заранее — совпадение по сырым байтам даже
+        # без strip/upper
+        self._table = {}
+        for cmd, resp in self.responses_bytes.items():
+            self._table[cmd] = resp
+            self._table[cmd + b'\n'] = resp
+            self._table[cmd + b'\r\n'] = resp
         
         logger.info(f"Инициализирован эмулятор устройства на {host}:{port}")
     
     def handle_command(self, command: str) -> str:
         """Обработка команд устройства"""
-        command = command.strip().upper()
-        
+        command = command.strip()
+
+        # Фреймированный пакет: несколько команд через "\n",
+        # ответы возвращаются одной датаграммой в том же порядке
+        if '\n' in command:
+            return '\n'.join(
+                self.handle_command(part)
+                for part in command.splitlines() if part.strip()
+            )
+
+        command = command.upper()
+
         if command in self.responses:
             response = self.responses[command]
             logger.debug(f"Получена команда: {command} -> Ответ: {response}")
@@ -47,61 +156,73 @@ class LNSDeviceServer:
             return "ERROR: Unknown command"
     
     def start(self):
-        """Запуск сервера"""
+        """Запуск сервера (блокирует до остановки)"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.bind((self.host, self.port))
-            self.socket.settimeout(1.0)  # Таймаут для graceful shutdown
-            self.running = True
-            
-            logger.info(f"Сервер запущен на {self.host}:{self.port}")
-            logger.info("Ожидание команд: GET_V, GET_A, GET_S")
-            print(f"=== LNS Device Emulator ===")
-            print(f"Listening on: {self.host}:{self.port}")
-            print("Commands supported: GET_V, GET_A, GET_S")
-            print("=" * 30)
-            
-            while self.running:
-                try:
-                    # Получаем данные
-                    data, addr = self.socket.recvfrom(1024)
-                    
-                    # Декодируем команду
-                    command = data.decode('utf-8', errors='ignore')
-                    
-                    # Логируем входящий запрос
-                    logger.info(f"Получено от {addr[0]}:{addr[1]}: {command}")
-                    
-                    # Обрабатываем команду
-                    response = self.handle_command(command)
-                    
-                    # Отправляем ответ
-                    self.socket.sendto(response.encode('utf-8'), addr)
-                    
-                    # Логируем исходящий ответ
-                    logger.debug(f"Отправлено {addr[0]}:{addr[1]}: {response}")
-                    
-                    # Выводим в консоль для наглядности
-                    print(f"[{time.strftime('%H:%M:%S')}] {addr[0]}:{addr[1]} -> {command} -> {response}")
-                    
-                except socket.timeout:
-                    continue  # Просто проверяем running
-                except Exception as e:
-                    if self.running:
-                        logger.error(f"Ошибка обработки: {e}")
-                    
+            asyncio.run(self._serve())
         except Exception as e:
             logger.error(f"Ошибка запуска сервера: {e}")
             raise
+
+    async def _serve(self):
+        """
+        Основной цикл на asyncio
+
+        Датаграммы раздаются через datagram_received по мере готовности
+        epoll; остановка — по событию, которое stop() может выставить
+        из любого потока.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self.running = True
+
+        # Сокет создаем сами, чтобы выставить буферы и SO_REUSEPORT
+        # (масштабирование на несколько процессов за одним портом)
+        # до bind; IP_MTU_DISCOVER=DONT — датаграммы маленькие,
+        # path-MTU discovery не нужен
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for opt, value in ((socket.SO_RCVBUF, 262144), (socket.SO_SNDBUF, 65536)):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, opt, value)
+            except OSError as e:
+                logger.debug(f"Не удалось установить буфер сокета: {e}")
+        if hasattr(socket, 'SO_REUSEPORT'):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError as e:
+                logger.debug(f"SO_REUSEPORT недоступен: {e}")
+        if hasattr(socket, 'IP_MTU_DISCOVER'):
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MTU_DISCOVER,
+                                socket.IP_PMTUDISC_DONT)
+            except OSError as e:
+                logger.debug(f"IP_MTU_DISCOVER недоступен: {e}")
+        sock.setblocking(False)
+        sock.bind((self.host, self.port))
+
+        transport, _ = await self._loop.create_datagram_endpoint(
+            lambda: LNSProtocol(self),
+            sock=sock
+        )
+
+        logger.info(f"Сервер запущен на {self.host}:{self.port}")
+        logger.info("Ожидание команд: GET_V, GET_A, GET_S")
+        print(f"=== LNS Device Emulator ===")
+        print(f"Listening on: {self.host}:{self.port}")
+        print("Commands supported: GET_V, GET_A, GET_S")
+        print("=" * 30)
+
+        try:
+            await self._stop_event.wait()
         finally:
-            self.stop()
-    
+            transport.close()
+            self.running = False
+            logger.info("Сервер остановлен")
+
     def stop(self):
-        """Остановка сервера"""
+        """Остановка сервера (можно вызывать из другого потока)"""
         self.running = False
-        if self.socket:
-            self.socket.close()
-            logger.info("Сервер остановлен")
+        if self._loop is not None and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
 
 
 def main():
@@ -111,10 +232,12 @@ def main():
     parser = argparse.ArgumentParser(description='LNS Device UDP Emulator')
     parser.add_argument('--host', default='127.0.0.1', help='Host to bind')
     parser.add_argument('--port', type=int, default=10000, help='Port to listen')
-    
+    parser.add_argument('--verbose', action='store_true',
+                        help='Печатать каждый пакет в консоль')
+
     args = parser.parse_args()
-    
-    server = LNSDeviceServer(host=args.host, port=args.port)
+
+    server = LNSDeviceServer(host=args.host, port=args.port, verbose=args.verbose)
     
     try:
         server.start()